@@ -1,7 +1,10 @@
 """
 Main URL Configuration for GrihaStay project
 """
+import os
+
 from django.contrib import admin
+from django.http import FileResponse
 from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
@@ -55,15 +58,38 @@ Most list endpoints support filtering, searching, and ordering. Check individual
     permission_classes=(permissions.AllowAny,),
 )
 
+# The schema is public and only changes on deploy, so cache rendered docs for a day
+SCHEMA_CACHE_TIMEOUT = 60 * 60 * 24
+SCHEMA_CACHE_KWARGS = {'key_prefix': 'api-schema'}
+SCHEMA_CONTENT_TYPES = {
+    '.json': 'application/json',
+    '.yaml': 'application/yaml',
+}
+dynamic_schema_view = schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS)
+
+
+def static_schema_view(request, format):
+    """
+    Serve the OpenAPI spec pre-generated at deploy time (see entrypoint.sh),
+    falling back to dynamic rendering when the file has not been generated.
+    """
+    schema_path = os.path.join(settings.STATIC_ROOT, f'swagger{format}')
+    try:
+        schema_file = open(schema_path, 'rb')
+    except OSError:
+        return dynamic_schema_view(request, format=format)
+    return FileResponse(schema_file, content_type=SCHEMA_CONTENT_TYPES[format])
+
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('core.urls')),
     
     # Swagger/OpenAPI Documentation URLs
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-    path('', schema_view.with_ui('swagger', cache_timeout=0), name='api-root'),  # Root redirects to Swagger
+    re_path(r'^swagger(?P<format>\.json|\.yaml)$', static_schema_view, name='schema-json'),
+    path('swagger/', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='schema-swagger-ui'),
+    path('redoc/', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='schema-redoc'),
+    path('', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='api-root'),  # Root redirects to Swagger
 ]
 
 # Serve media files in development
@@ -1,34 +1,68 @@
+import errno
 import os
 from typing import Type
-from shutil import move
+from shutil import copyfile
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models import Model, QuerySet
+from django.db.models import Case, CharField, Model, Q, QuerySet, Value, When
+from django.utils import timezone
 from core.models import Multimedia
 
 
-def move_files(media_qs: QuerySet[Multimedia], instance: Type[Model], field_name: str) -> None:
+def _move_file(src: str, dst: str) -> None:
+    """
+    Move a file with a plain rename, falling back to copy + unlink when the
+    source and destination live on different devices (e.g. bind mounts).
+    `shutil.copyfile` uses `os.sendfile` on Linux, so the copy stays in the kernel.
+    """
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        copyfile(src, dst)
+        os.unlink(src)
+
+
+def move_files(media_qs: QuerySet[Multimedia], instance: Type[Model], field_name: str | None = None) -> None:
+    """
+    Move files into the directory of the instance they are assigned to.
+    When no field name is given, each file goes to the directory of its own `field_name`.
+    """
     media_dir = settings.MEDIA_ROOT
     model_name = instance.__class__.__name__.lower()
+    # The target directory only depends on the field name and protected flag,
+    # so resolve each variant once and create each directory at most once per call.
+    target_paths = {}
+    created_dirs = set()
+    updated = []
+    now = timezone.now()
     for media in media_qs:
-        new_path = f"{model_name}/{instance.id}/{field_name}/"
-        if media.protected:
-            new_path = f"protected/{new_path}"
+        key = (field_name or media.field_name, media.protected)
+        new_path = target_paths.get(key)
+        if new_path is None:
+            new_path = f"{model_name}/{instance.id}/{key[0]}/"
+            if media.protected:
+                new_path = f"protected/{new_path}"
+            target_paths[key] = new_path
+        if new_path not in created_dirs:
+            os.makedirs(os.path.join(media_dir, new_path), exist_ok=True)
+            created_dirs.add(new_path)
 
         filename = media.file.name.split("/")[-1]
         old_media_path = os.path.join(media_dir, media.file.path)
-        if not os.path.exists(os.path.join(media_dir, new_path)):
-            os.makedirs(os.path.join(media_dir, new_path))
-
         new_media_path = os.path.join(media_dir, new_path, filename)
         try:
-            move(old_media_path, new_media_path)
+            _move_file(old_media_path, new_media_path)
             media.file = new_path + filename
-            media.save()
         except FileNotFoundError:
             media.file = None
-            media.save()
+            media.size_bytes = 0
+        media.updated_at = now
+        updated.append(media)
+
+    Multimedia.objects.bulk_update(updated, ["file", "size_bytes", "updated_at"], batch_size=500)
 
 
 def get_related_files_by_field_name(field_name: str, instance: Type[Model]):
@@ -40,8 +74,7 @@ def get_related_files_by_field_name(field_name: str, instance: Type[Model]):
     """
 
     try:
-        model_ = instance.__class__
-        content_type = ContentType.objects.get_for_model(model_)
+        content_type = ContentType.objects.get_for_model(instance.__class__)
         id_ = instance.id
         related_files = Multimedia.objects.filter(
             content_type=content_type,
@@ -53,8 +86,23 @@ def get_related_files_by_field_name(field_name: str, instance: Type[Model]):
         return None
 
 
+def get_related_files_for_instances(instances: list[Model], field_names: list[str]) -> QuerySet[Multimedia]:
+    """
+    Get related files of several instances of the same model in one query.
+    Args:
+        instances (list[Model]): instances of the model to get related files for.
+        field_names (list[str]): names of the fields used when uploading files.
+    """
+    content_type = ContentType.objects.get_for_model(instances[0].__class__)
+    return Multimedia.objects.filter(
+        content_type=content_type,
+        object_id__in=[instance.id for instance in instances],
+        field_name__in=field_names,
+    )
+
+
 def delete_associated_files(instance: Type[Model], field_name: str, files: list[int]) -> None:
-    content_type = ContentType.objects.get_for_model(instance)
+    content_type = ContentType.objects.get_for_model(instance.__class__)
     Multimedia.objects.filter(
         content_type=content_type,
         object_id=instance.id,
@@ -62,7 +110,6 @@ def delete_associated_files(instance: Type[Model], field_name: str, files: list[
     ).exclude(id__in=files).delete()
 
 
-@transaction.atomic
 def assign_files_to_instance(instance: Type[Model], field_name: str, files: list[int]) -> None:
     """
     Assign files to a given instance and field name.
@@ -71,11 +118,39 @@ def assign_files_to_instance(instance: Type[Model], field_name: str, files: list
         field_name (str): name of the field
         files (list): list of file IDs to assign to the instance.
     """
-    content_type = ContentType.objects.get_for_model(instance)
-    delete_associated_files(instance, field_name, files)
-    multimedia = Multimedia.objects.filter(id__in=files)
-    multimedia.update(content_type=content_type, object_id=instance.id, field_name=field_name)
-    move_files(multimedia, instance, field_name)
+    assign_media_to_instance(instance, {field_name: files})
+
+
+@transaction.atomic
+def assign_media_to_instance(instance: Type[Model], media_fields: dict[str, list[int]]) -> None:
+    """
+    Assign files of several fields to a given instance with one DELETE and one UPDATE.
+    Files previously assigned to one of the fields but missing from its list are deleted.
+    Args:
+        instance (Type[Model]): instance of the model to which files will be assigned.
+        media_fields (dict): mapping of field name to the list of file IDs to assign.
+    """
+    if not media_fields:
+        return
+    content_type = ContentType.objects.get_for_model(instance.__class__)
+    stale = Q()
+    for field_name, files in media_fields.items():
+        stale |= Q(field_name=field_name) & ~Q(id__in=files)
+    Multimedia.objects.filter(content_type=content_type, object_id=instance.id).filter(stale).delete()
+
+    all_files = [file_id for files in media_fields.values() for file_id in files]
+    if not all_files:
+        return
+    multimedia = Multimedia.objects.filter(id__in=all_files)
+    multimedia.update(
+        content_type=content_type,
+        object_id=instance.id,
+        field_name=Case(
+            *(When(id__in=files, then=Value(field_name)) for field_name, files in media_fields.items()),
+            output_field=CharField(),
+        ),
+    )
+    move_files(multimedia, instance)
 
 
 def get_uploaded_media(instance: Type[Model]) -> QuerySet[Multimedia] | None:
@@ -85,7 +160,7 @@ def get_uploaded_media(instance: Type[Model]) -> QuerySet[Multimedia] | None:
         instance (Type[Model]): instance of the model to get uploaded media for.
     """
     try:
-        content_type = ContentType.objects.get_for_model(instance)
+        content_type = ContentType.objects.get_for_model(instance.__class__)
         uploaded_media = Multimedia.objects.filter(
             content_type=content_type,
             object_id=instance.id,
@@ -101,10 +176,10 @@ def duplicate_media_queryset(files: list[int]) -> list[int]:
     Args:
         files (list): list of media IDs to duplicate.
     """
-    result = []
-    qs = Multimedia.objects.filter(id__in=files)
-    for f in qs:
-        f.pk = None
-        f.save()
-        result.append(f.id)
-    return result
+    copied_fields = [f.attname for f in Multimedia._meta.concrete_fields if not f.primary_key]
+    duplicates = [
+        Multimedia(**{name: getattr(media, name) for name in copied_fields})
+        for media in Multimedia.objects.filter(id__in=files)
+    ]
+    created = Multimedia.objects.bulk_create(duplicates, batch_size=500)
+    return [media.id for media in created]
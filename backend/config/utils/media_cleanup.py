@@ -6,15 +6,20 @@ to any entity (content_type and object_id are NULL).
 """
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from django.conf import settings
 from django.db import transaction, DatabaseError, IntegrityError
+from django.db.models import Count, Min, Q, QuerySet, Sum
 from django.utils import timezone
 from core.models import Multimedia
 
 logger = logging.getLogger(__name__)
 
+# Number of threads used to delete files concurrently during cleanup
+CLEANUP_MAX_WORKERS = 8
+
 
 def identify_orphaned_media(grace_period_hours: int = 24) -> Dict[str, any]:
     """
@@ -46,25 +51,17 @@ def identify_orphaned_media(grace_period_hours: int = 24) -> Dict[str, any]:
     
     # Use values_list to get IDs efficiently
     orphaned_ids = list(orphaned.values_list('id', flat=True))
-    count = len(orphaned_ids)
-    
-    # Calculate total size and find oldest in single pass
-    total_size = 0
-    oldest_timestamp = None
     
-    # Use iterator() to avoid loading all objects into memory at once
-    for media in orphaned.iterator():
-        if oldest_timestamp is None:
-            oldest_timestamp = media.created_at
-            
-        if media.file:
-            try:
-                file_path = media.file.path
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
-            except (OSError, IOError) as e:
-                # File system errors are non-critical for statistics
-                logger.debug(f"Could not get size for media {media.id}: {e}")
+    # Count, total size and oldest timestamp in a single aggregate query
+    # using the stored size_bytes column (no filesystem access required)
+    totals = orphaned.aggregate(
+        count=Count('id'),
+        total=Sum('size_bytes'),
+        oldest=Min('created_at'),
+    )
+    count = totals['count']
+    total_size = totals['total'] or 0
+    oldest_timestamp = totals['oldest']
     
     return {
         'orphaned_count': count,
@@ -76,6 +73,37 @@ def identify_orphaned_media(grace_period_hours: int = 24) -> Dict[str, any]:
     }
 
 
+def _safe_size(path: str) -> Optional[int]:
+    """Return the size of the file at path, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def _media_file_path(file_name: str) -> str:
+    """Resolve a stored file name to its absolute path under MEDIA_ROOT."""
+    return os.path.join(settings.MEDIA_ROOT, file_name)
+
+
+def _delete_file(file_path: str, media_id: int) -> bool:
+    """
+    Delete a single file from disk, treating an already missing file as deleted.
+    
+    Returns:
+        True if file was deleted successfully, False otherwise
+    """
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        return True
+    except (OSError, IOError) as e:
+        logger.error(f"Failed to delete file for media {media_id}: {str(e)}")
+        return False
+    logger.info(f"Deleted file: {file_path}")
+    return True
+
+
 def delete_media_file(media: Multimedia) -> bool:
     """
     Safely delete a media file from disk.
@@ -89,42 +117,204 @@ def delete_media_file(media: Multimedia) -> bool:
     if not media.file:
         return True
     
+    return _delete_file(_media_file_path(media.file.name), media.id)
+
+
+def remove_empty_directories(directories: Iterable[str]) -> None:
+    """
+    Remove the given directories if they are empty, deepest first so that
+    nested empty directories are removed before their parents.
+    Only directories strictly inside MEDIA_ROOT are considered.
+    
+    Args:
+        directories: Directories that contained deleted media files
+    """
+    media_root_abs = os.path.abspath(settings.MEDIA_ROOT)
+    candidates = {os.path.abspath(d) for d in directories}
+    for directory in sorted(candidates, key=lambda d: d.count(os.sep), reverse=True):
+        if not directory.startswith(media_root_abs + os.sep):
+            continue
+        try:
+            os.rmdir(directory)
+            logger.info(f"Removed empty directory: {directory}")
+        except OSError as e:
+            # Directory not empty or permission issue - safe to ignore
+            logger.debug(f"Could not remove directory {directory}: {e}")
+
+
+def _iter_keyset_batches(queryset: QuerySet, batch_size: int) -> Iterator[List[tuple]]:
+    """
+    Yield successive batches of up to batch_size (id, file, created_at) rows
+    ordered by (created_at, id). Each batch is fetched with its own indexed
+    range query starting after the last key of the previous batch, so no
+    OFFSET scans or long-lived server-side cursors are needed. Rows are
+    streamed as tuples to skip model instantiation.
+    """
+    queryset = queryset.order_by('created_at', 'id').values_list('id', 'file', 'created_at')
+    batch = list(queryset[:batch_size])
+    while batch:
+        yield batch
+        last_id, _, last_created_at = batch[-1]
+        batch = list(queryset.filter(
+            Q(created_at__gt=last_created_at) | Q(created_at=last_created_at, id__gt=last_id)
+        )[:batch_size])
+
+
+def _delete_orphan_file(row: tuple) -> Tuple[int, bool, int, Optional[str]]:
+    """
+    Delete the file of a single orphaned media row.
+    
+    Args:
+        row: (id, file, created_at) tuple of the orphaned media
+    
+    Returns:
+        Tuple of (media id, whether the file was deleted, size in bytes,
+        unexpected error message or None)
+    """
+    media_id, file_name, _ = row
+    if not file_name:
+        return media_id, True, 0, None
     try:
-        file_path = media.file.path
-        if not os.path.exists(file_path):
-            return True
-            
-        os.remove(file_path)
-        logger.info(f"Deleted file: {file_path}")
+        # Resolve the path once and calculate file size before deletion
+        file_path = _media_file_path(file_name)
+        file_size = _safe_size(file_path) or 0
+        return media_id, _delete_file(file_path, media_id), file_size, None
+    except Exception as e:
+        return media_id, False, 0, str(e)
+
+
+def _delete_orphan_batch(batch: List[tuple], executor: ThreadPoolExecutor) -> Dict[str, any]:
+    """
+    Delete the files of a batch of orphaned media, then remove their
+    database records with a single DELETE statement.
+    
+    Args:
+        batch: (id, file, created_at) rows of the media to delete
+        executor: Thread pool used to delete the files concurrently
         
-        # Try to remove empty parent directories (only within MEDIA_ROOT)
+    Returns:
+        Dictionary containing deleted_count, failed_count, size_freed
+        (in bytes) and errors for the batch
+    """
+    deleted_count = 0
+    failed_count = 0
+    size_freed = 0
+    errors = []
+    
+    # Delete the physical files FIRST (outside transaction)
+    # This prevents orphaned files if DB transaction rolls back.
+    # Deletion is I/O-bound, so the unlinks of a batch run concurrently.
+    file_results = []
+    for media_id, file_deleted, file_size, error in executor.map(_delete_orphan_file, batch):
+        if error is None:
+            file_results.append((media_id, file_deleted, file_size))
+            continue
+        # Unexpected errors are recorded so processing can continue
+        failed_count += 1
+        error_msg = f"Unexpected error deleting media {media_id}: {error}"
+        errors.append(error_msg)
+        logger.error(error_msg)
+    
+    if file_results:
+        # Delete the database records in one statement (wrapped in transaction)
+        media_ids = [media_id for media_id, _, _ in file_results]
         try:
-            parent_dir = os.path.dirname(file_path)
-            media_root_abs = os.path.abspath(settings.MEDIA_ROOT)
-            parent_dir_abs = os.path.abspath(parent_dir)
-            
-            # Ensure parent directory is within MEDIA_ROOT and is empty
-            if (parent_dir_abs.startswith(media_root_abs) and 
-                parent_dir_abs != media_root_abs and
-                not os.listdir(parent_dir_abs)):
-                os.rmdir(parent_dir_abs)
-                logger.info(f"Removed empty directory: {parent_dir_abs}")
-        except (OSError, IOError) as e:
-            # Directory not empty or permission issue - safe to ignore
-            logger.debug(f"Could not remove directory {parent_dir}: {e}")
-            
-        return True
-    except (OSError, IOError) as e:
-        logger.error(f"Failed to delete file for media {media.id}: {str(e)}")
-        return False
+            with transaction.atomic():
+                Multimedia.objects.filter(id__in=media_ids).delete()
+        except (DatabaseError, IntegrityError) as e:
+            logger.error(f"Database error deleting media batch: {e}")
+            failed_count += len(media_ids)
+            errors.extend(f"Database error for media {media_id}: {str(e)}" for media_id in media_ids)
+            file_results = []
     
-    return True
+    for media_id, file_deleted, file_size in file_results:
+        if file_deleted:
+            deleted_count += 1
+            size_freed += file_size
+            logger.info(f"Successfully deleted orphaned media: {media_id}")
+        else:
+            failed_count += 1
+            error_msg = f"Failed to delete file for media: {media_id}"
+            errors.append(error_msg)
+            logger.warning(error_msg)
+    
+    return {
+        'deleted_count': deleted_count,
+        'failed_count': failed_count,
+        'size_freed': size_freed,
+        'errors': errors,
+    }
+
+
+def _orphaned_queryset(grace_period_hours: int) -> QuerySet:
+    """Unlinked media created before the grace period cutoff."""
+    cutoff_time = timezone.now() - timedelta(hours=grace_period_hours)
+    return Multimedia.objects.filter(
+        content_type__isnull=True,
+        object_id__isnull=True,
+        created_at__lt=cutoff_time
+    )
+
+
+def iter_orphaned_media_id_chunks(
+    grace_period_hours: int = 24,
+    chunk_size: int = 100
+) -> Iterator[List[int]]:
+    """
+    Yield the IDs of orphaned media in keyset-paginated chunks.
+    
+    Each chunk can be handed to delete_orphaned_media_chunk() independently,
+    e.g. by a task queue fanning the cleanup out over several workers.
+    
+    Args:
+        grace_period_hours: Hours to wait before considering a file orphaned (default: 24)
+        chunk_size: Number of IDs per chunk (default: 100)
+    """
+    for batch in _iter_keyset_batches(_orphaned_queryset(grace_period_hours), chunk_size):
+        yield [media_id for media_id, _, _ in batch]
+
+
+def delete_orphaned_media_chunk(
+    media_ids: Iterable[int],
+    max_workers: int = CLEANUP_MAX_WORKERS
+) -> Dict[str, any]:
+    """
+    Delete one chunk of orphaned media files and their database records.
+    
+    Orphan status is re-checked for every ID, so a chunk is safe to retry
+    and media linked since the chunk was queued is left untouched.
+    
+    Args:
+        media_ids: IDs produced by iter_orphaned_media_id_chunks()
+        max_workers: Number of threads deleting files concurrently (default: 8)
+        
+    Returns:
+        Dictionary containing deleted_count, failed_count, size_freed
+        (in bytes) and errors for the chunk
+    """
+    rows = list(
+        Multimedia.objects.filter(
+            id__in=list(media_ids),
+            content_type__isnull=True,
+            object_id__isnull=True
+        ).values_list('id', 'file', 'created_at')
+    )
+    if not rows:
+        return {'deleted_count': 0, 'failed_count': 0, 'size_freed': 0, 'errors': []}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        result = _delete_orphan_batch(rows, executor)
+    remove_empty_directories(
+        os.path.dirname(_media_file_path(file_name)) for _, file_name, _ in rows if file_name
+    )
+    return result
 
 
 def cleanup_orphaned_media(
     grace_period_hours: int = 24,
     dry_run: bool = False,
-    batch_size: int = 100
+    batch_size: int = 100,
+    max_workers: int = CLEANUP_MAX_WORKERS
 ) -> Dict[str, any]:
     """
     Clean up orphaned media files from database and disk.
@@ -137,6 +327,7 @@ def cleanup_orphaned_media(
         grace_period_hours: Hours to wait before considering a file orphaned (default: 24)
         dry_run: If True, only identify orphans without deleting (default: False)
         batch_size: Number of records to process in each batch (default: 100)
+        max_workers: Number of threads deleting files concurrently (default: 8)
         
     Returns:
         Dictionary containing:
@@ -147,26 +338,21 @@ def cleanup_orphaned_media(
         - total_size_freed_mb: Size freed in MB
         - errors: List of error messages
     """
-    cutoff_time = timezone.now() - timedelta(hours=grace_period_hours)
-    
-    orphaned = Multimedia.objects.filter(
-        content_type__isnull=True,
-        object_id__isnull=True,
-        created_at__lt=cutoff_time
-    )
+    # Cleanup only needs the id and file of each row
+    orphaned = _orphaned_queryset(grace_period_hours).only('id', 'file', 'created_at')
     
-    identified_count = orphaned.count()
     deleted_count = 0
     failed_count = 0
     total_size_freed = 0
     errors = []
     
-    logger.info(
-        f"{'[DRY RUN] ' if dry_run else ''}Found {identified_count} orphaned media files "
-        f"older than {grace_period_hours} hours"
-    )
-    
     if dry_run:
+        identified_count = orphaned.count()
+        logger.info(
+            f"[DRY RUN] Found {identified_count} orphaned media files "
+            f"older than {grace_period_hours} hours"
+        )
+        
         # Just report what would be deleted (use iterator for efficiency)
         sample_count = 0
         for media in orphaned.iterator():
@@ -184,64 +370,32 @@ def cleanup_orphaned_media(
             'errors': [],
         }
     
-    # Process in batches to avoid memory issues with large datasets
-    processed = 0
+    logger.info(f"Cleaning up orphaned media files older than {grace_period_hours} hours")
     
-    # Use iterator() for efficient batch processing
-    orphaned_batch = orphaned.iterator(chunk_size=batch_size)
+    # Process in batches to avoid memory issues with large datasets.
+    # The total is not counted up front; every streamed row is an identified orphan.
+    processed = 0
+    touched_dirs = set()
     
-    for media in orphaned_batch:
-        try:
-            # Calculate file size before deletion
-            file_size = 0
-            if media.file:
-                try:
-                    file_path = media.file.path
-                    if os.path.exists(file_path):
-                        file_size = os.path.getsize(file_path)
-                except (OSError, IOError) as e:
-                    logger.warning(f"Could not get size for media {media.id}: {e}")
-            
-            # Delete the physical file FIRST (outside transaction)
-            # This prevents orphaned files if DB transaction rolls back
-            file_deleted = delete_media_file(media)
+    # Keyset pagination keeps every batch an indexed range scan
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch in _iter_keyset_batches(orphaned, batch_size):
+            result = _delete_orphan_batch(batch, executor)
+            touched_dirs.update(
+                os.path.dirname(_media_file_path(file_name)) for _, file_name, _ in batch if file_name
+            )
+            deleted_count += result['deleted_count']
+            failed_count += result['failed_count']
+            total_size_freed += result['size_freed']
+            errors.extend(result['errors'])
             
-            # Delete the database record (wrapped in transaction)
-            media_id = media.id
-            try:
-                with transaction.atomic():
-                    media.delete()
-            except (DatabaseError, IntegrityError) as e:
-                logger.error(f"Database error deleting media {media_id}: {e}")
-                failed_count += 1
-                error_msg = f"Database error for media {media_id}: {str(e)}"
-                errors.append(error_msg)
-                continue
-            
-            if file_deleted:
-                deleted_count += 1
-                total_size_freed += file_size
-                logger.info(f"Successfully deleted orphaned media: {media_id}")
-            else:
-                failed_count += 1
-                error_msg = f"Failed to delete file for media: {media_id}"
-                errors.append(error_msg)
-                logger.warning(error_msg)
-                
-        except Exception as e:
-            # Catch any unexpected errors to continue processing
-            failed_count += 1
-            error_msg = f"Unexpected error deleting media {media.id}: {str(e)}"
-            errors.append(error_msg)
-            logger.error(error_msg)
-        
-        processed += 1
-        if processed % batch_size == 0:
-            logger.info(f"Processed {processed}/{identified_count} orphaned media files")
+            processed += len(batch)
+            logger.info(f"Processed {processed} orphaned media files")
     
-    if processed > 0:
-        logger.info(f"Processed {processed}/{identified_count} orphaned media files")
+    # Empty directories are pruned once at the end instead of after every file
+    remove_empty_directories(touched_dirs)
     
+    identified_count = processed
     total_size_freed_mb = round(total_size_freed / (1024 * 1024), 2)
     
     logger.info(
@@ -266,35 +420,22 @@ def get_media_statistics() -> Dict[str, any]:
     Returns:
         Dictionary containing various media statistics
     """
-    total_media = Multimedia.objects.count()
-    linked_media = Multimedia.objects.filter(
-        content_type__isnull=False,
-        object_id__isnull=False
-    ).count()
-    orphaned_media = Multimedia.objects.filter(
-        content_type__isnull=True,
-        object_id__isnull=True
-    ).count()
-    
-    # Calculate storage size efficiently using iterator()
-    total_size = 0
-    orphaned_size = 0
-    
-    # Use iterator() to process records efficiently without loading all into memory
-    for media in Multimedia.objects.iterator():
-        if media.file:
-            try:
-                file_path = media.file.path
-                if os.path.exists(file_path):
-                    size = os.path.getsize(file_path)
-                    total_size += size
-                    
-                    # Check if this media is orphaned
-                    if not media.content_type and not media.object_id:
-                        orphaned_size += size
-            except (OSError, IOError) as e:
-                # File system errors are non-critical for statistics
-                logger.debug(f"Could not get size for media {media.id}: {e}")
+    orphan_filter = Q(content_type__isnull=True, object_id__isnull=True)
+    linked_filter = Q(content_type__isnull=False, object_id__isnull=False)
+    
+    # Counts and sizes (from the stored size_bytes column) in one query
+    stats = Multimedia.objects.aggregate(
+        total=Count('id'),
+        linked=Count('id', filter=linked_filter),
+        orphaned=Count('id', filter=orphan_filter),
+        total_size=Sum('size_bytes'),
+        orphaned_size=Sum('size_bytes', filter=orphan_filter),
+    )
+    total_media = stats['total']
+    linked_media = stats['linked']
+    orphaned_media = stats['orphaned']
+    total_size = stats['total_size'] or 0
+    orphaned_size = stats['orphaned_size'] or 0
     
     return {
         'total_media_count': total_media,
@@ -1,7 +1,13 @@
 from abc import abstractmethod
+from collections import defaultdict
+from django.db.models import Manager
+from django.utils.functional import cached_property
 from rest_framework import decorators, permissions, serializers
 from core import models
-from .media import assign_files_to_instance, get_related_files_by_field_name
+from .media import assign_media_to_instance, get_related_files_by_field_name, get_related_files_for_instances
+
+
+_MISSING = object()
 
 
 class MultimediaSerializer(serializers.ModelSerializer):
@@ -9,7 +15,18 @@ class MultimediaSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = models.Multimedia
-        fields = "__all__"
+        fields = (
+            "id",
+            "title",
+            "file",
+            "field_name",
+            "protected",
+            "created_by",
+            "content_type",
+            "object_id",
+            "created_at",
+            "updated_at",
+        )
 
 
 class PublicRouteMixin:
@@ -26,9 +43,46 @@ class PublicRouteMixin:
         return self.list(request, *args, **kwargs)
 
 
+class MediaListSerializer(serializers.ListSerializer):
+    """List serializer that loads the media of every item in one query"""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, Manager) else data
+        instances = list(iterable)
+        self.child.prefetch_media(instances)
+        return super().to_representation(instances)
+
+
 class RetriveMediaMixin:
     """Mixin that retrieve media grouped by field name"""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = MediaListSerializer
+
+    @classmethod
+    def prefetch_media(cls, instances):
+        """
+        Load the media of all instances with a single query and attach it,
+        grouped by field name, as `_prefetched_media` on each instance.
+        """
+        media_fields = getattr(cls.Meta, "media_fields", [])
+        if not media_fields or not instances:
+            return
+        grouped = defaultdict(list)
+        media_qs = get_related_files_for_instances(instances, media_fields).only(*MultimediaSerializer.Meta.fields)
+        for media in media_qs:
+            grouped[(media.object_id, media.field_name)].append(media)
+        for instance in instances:
+            instance._prefetched_media = {field: grouped[(instance.id, field)] for field in media_fields}
+
+    @cached_property
+    def _media_serializer(self):
+        """Media serializer shared by every field and, in list views, every item"""
+        return MultimediaSerializer(context=self.context)
+
     def to_representation(self, instance):
         """
         Override the to_representation method to include media files
@@ -37,10 +91,13 @@ class RetriveMediaMixin:
         data = super().to_representation(instance)
         media_data = {}
         media_fields = getattr(self.Meta, "media_fields", [])
+        prefetched = getattr(instance, "_prefetched_media", None)
         for field in media_fields:
-            qs = get_related_files_by_field_name(instance=instance, field_name=field)
-            serializer = MultimediaSerializer(qs, many=True, context=self.context)
-            media_data[field] = serializer.data
+            if prefetched is not None:
+                qs = prefetched[field]
+            else:
+                qs = get_related_files_by_field_name(instance=instance, field_name=field)
+            media_data[field] = [self._media_serializer.to_representation(media) for media in qs or ()]
         # data.update(media_data)
         return {**data, **media_data}
 
@@ -62,29 +119,34 @@ class CreateMediaMixin:
 
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.media_fields = getattr(self.Meta, "media_fields", [])
-        for field in self.media_fields:
-            self.fields[field] = serializers.ListField(write_only=True, required=False)
+    media_fields = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        if meta is None or not hasattr(cls, "_declared_fields"):
+            return
+        # Declare the media fields once per class; DRF copies declared fields per instance
+        cls.media_fields = getattr(meta, "media_fields", [])
+        for field in cls.media_fields:
+            cls._declared_fields[field] = serializers.ListField(write_only=True, required=False)
 
     def __extract_media_fields(self, validated_data):
         fields = {}
         for field_name in self.media_fields:
-            try:
-                value = validated_data.pop(field_name)
+            value = validated_data.pop(field_name, _MISSING)
+            if value is not _MISSING:
                 fields[field_name] = value
-            except KeyError:
-                ...
         return fields
 
     def __handle_media_fields(self, instance, media_fields):
         """
         Handle media fields by assigning files to the instance.
         """
-        for field_name, value in media_fields.items():
-            value = value if isinstance(value, list) else [value]
-            assign_files_to_instance(instance, field_name=field_name, files=value)
+        assign_media_to_instance(
+            instance,
+            {field_name: value if isinstance(value, list) else [value] for field_name, value in media_fields.items()},
+        )
         return instance
 
     def create(self, validated_data):
@@ -101,12 +163,8 @@ class CreateMediaMixin:
         Override the update method to handle media fields.
 
         """
-        media_fields = getattr(self.Meta, "media_fields", [])
-        for field in media_fields:
-            media = validated_data.pop(field, None)
-            if media is not None:
-                media_fields = media if isinstance(media, list) else [media]
-                assign_files_to_instance(instance, field_name=field, files=media)
+        media_fields = self.__extract_media_fields(validated_data)
+        self.__handle_media_fields(instance, media_fields)
         return super().update(instance, validated_data)
 
 
@@ -2,169 +2,278 @@
 Django Admin Configuration for GrihaStay models
 """
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.gis.admin import OSMGeoAdmin
-from .models import *
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from .models import (
+    Country,
+    State,
+    District,
+    Municipality,
+    City,
+    Community,
+    Tenant,
+    TenantUser,
+    PropertyType,
+    Amenity,
+    Property,
+    HouseRule,
+    PropertyHouseRule,
+    RoomType,
+    Room,
+    RatePlan,
+    Inventory,
+    Guest,
+    Booking,
+    Payment,
+    Invoice,
+    Payout,
+    AuditLog,
+)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses PostgreSQL's table row estimate for unfiltered
+    changelists instead of running COUNT(*) over the whole table.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                # A partitioned parent is never analyzed by autovacuum, so sum
+                # the estimates of its partitions instead
+                cursor.execute(
+                    "SELECT (CASE WHEN p.relkind = 'p' THEN ("
+                    '    SELECT SUM(GREATEST(c.reltuples, 0)) FROM pg_inherits i'
+                    '    JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = p.oid'
+                    ') ELSE p.reltuples END)::bigint FROM pg_class p WHERE p.relname = %s',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 (or 0) until the table has been analyzed
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
+class EstimatedCountAdminMixin:
+    """Admin mixin for large tables: estimated page counts, no full result count"""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class DeferredChangeList(ChangeList):
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        return queryset.defer(*self.model_admin.list_defer_fields)
+
+
+class DeferredListFieldsAdminMixin:
+    """Admin mixin that leaves large payload columns out of changelist queries"""
+    list_defer_fields = ()
+
+    def get_changelist(self, request, **kwargs):
+        return DeferredChangeList
 
 
-@admin.register(Country)
 class CountryAdmin(admin.ModelAdmin):
     list_display = ['name', 'code', 'created_at']
     search_fields = ['name', 'code']
 
 
-@admin.register(State)
 class StateAdmin(admin.ModelAdmin):
     list_display = ['name', 'code', 'country', 'created_at']
+    list_select_related = ['country']
     search_fields = ['name', 'code']
     list_filter = ['country']
 
 
-@admin.register(District)
 class DistrictAdmin(admin.ModelAdmin):
     list_display = ['name', 'code', 'state', 'created_at']
+    list_select_related = ['state']
     search_fields = ['name', 'code']
     list_filter = ['state']
 
 
-@admin.register(Municipality)
 class MunicipalityAdmin(admin.ModelAdmin):
     list_display = ['name', 'code', 'district', 'created_at']
+    list_select_related = ['district']
     search_fields = ['name', 'code']
     list_filter = ['district']
 
 
-@admin.register(City)
 class CityAdmin(admin.ModelAdmin):
     list_display = ['name', 'district', 'created_at']
+    list_select_related = ['district']
     search_fields = ['name']
     list_filter = ['district']
 
 
-@admin.register(Community)
 class CommunityAdmin(admin.ModelAdmin):
     list_display = ['name', 'municipality', 'district', 'state', 'created_at']
+    list_select_related = ['municipality', 'district', 'state']
     search_fields = ['name', 'description']
     list_filter = ['state', 'district', 'municipality']
 
-@admin.register(Tenant)
+
 class TenantAdmin(admin.ModelAdmin):
     list_display = ['name', 'contact_email', 'contact_phone', 'plan', 'created_at']
     search_fields = ['name', 'contact_email', 'registration_number']
     list_filter = ['plan', 'currency']
 
 
-@admin.register(TenantUser)
 class TenantUserAdmin(admin.ModelAdmin):
     list_display = ['user_name', 'full_name', 'email', 'tenant', 'role', 'is_active', 'created_at']
+    list_select_related = ['tenant']
     search_fields = ['user_name', 'email', 'full_name']
     list_filter = ['tenant', 'role', 'is_active']
     readonly_fields = ['last_login', 'created_at', 'updated_at']
 
 
-@admin.register(PropertyType)
 class PropertyTypeAdmin(admin.ModelAdmin):
     list_display = ['name', 'description']
     search_fields = ['name']
 
 
-@admin.register(Amenity)
 class AmenityAdmin(admin.ModelAdmin):
     list_display = ['name', 'description']
     search_fields = ['name']
 
 
-@admin.register(Property)
 class PropertyAdmin(OSMGeoAdmin):
     list_display = ['name', 'tenant', 'property_type', 'status', 'city', 'created_at']
+    list_select_related = ['tenant', 'property_type', 'city']
+    raw_id_fields = ['tenant', 'municipality', 'city', 'community']
     search_fields = ['name', 'description', 'address']
     list_filter = ['tenant', 'property_type', 'status', 'state', 'district']
     readonly_fields = ['created_at', 'updated_at']
 
 
-@admin.register(HouseRule)
 class HouseRuleAdmin(admin.ModelAdmin):
     list_display = ['title', 'is_allowed', 'is_visible_to_guest', 'created_at']
     search_fields = ['title', 'description']
     list_filter = ['is_allowed', 'is_visible_to_guest']
 
 
-@admin.register(PropertyHouseRule)
 class PropertyHouseRuleAdmin(admin.ModelAdmin):
     list_display = ['property', 'house_rule', 'order']
+    list_select_related = ['property__tenant', 'house_rule']
+    raw_id_fields = ['property']
     search_fields = ['property__name', 'house_rule__title']
     list_filter = ['property']
     ordering = ['order']
 
 
-@admin.register(RoomType)
 class RoomTypeAdmin(admin.ModelAdmin):
     list_display = ['name', 'property', 'max_occupancy', 'default_base_price', 'created_at']
+    list_select_related = ['property__tenant']
+    raw_id_fields = ['property']
     search_fields = ['name', 'slug']
     list_filter = ['property']
 
 
-@admin.register(Room)
 class RoomAdmin(admin.ModelAdmin):
     list_display = ['room_number', 'room_type', 'status', 'price_override']
+    list_select_related = ['room_type__property']
+    raw_id_fields = ['room_type']
     search_fields = ['room_number']
     list_filter = ['room_type', 'status']
 
 
-@admin.register(RatePlan)
 class RatePlanAdmin(admin.ModelAdmin):
     list_display = ['name', 'property', 'room_type', 'base_price', 'active', 'created_at']
+    list_select_related = ['property__tenant', 'room_type__property']
+    raw_id_fields = ['property', 'room_type']
     search_fields = ['name']
     list_filter = ['property', 'active']
 
 
-@admin.register(Inventory)
 class InventoryAdmin(admin.ModelAdmin):
     list_display = ['room_type', 'dt', 'available_count', 'blocked_count', 'updated_at']
+    list_select_related = ['room_type__property']
+    raw_id_fields = ['room_type']
     list_filter = ['room_type', 'dt']
     date_hierarchy = 'dt'
 
 
-@admin.register(Guest)
 class GuestAdmin(admin.ModelAdmin):
     list_display = ['name', 'email', 'phone', 'nationality', 'created_at']
     search_fields = ['name', 'email', 'phone']
 
 
-@admin.register(Booking)
-class BookingAdmin(admin.ModelAdmin):
+class BookingAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['id', 'property', 'room_type', 'checkin', 'checkout', 'status', 'payment_status', 'total_amount', 'created_at']
+    list_select_related = ['property__tenant', 'room_type__property']
+    raw_id_fields = ['tenant', 'property', 'room_type', 'room']
     search_fields = ['external_id']
-    list_filter = ['tenant', 'property', 'status', 'payment_status', 'source']
-    date_hierarchy = 'checkin'
+    list_filter = ['tenant', 'property', 'status', 'payment_status', 'source', 'checkin']
     readonly_fields = ['created_at', 'updated_at']
 
 
-@admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
+class PaymentAdmin(DeferredListFieldsAdminMixin, EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['booking', 'method', 'amount', 'status', 'transaction_id', 'created_at']
+    list_select_related = ['booking__property']
+    raw_id_fields = ['booking']
     search_fields = ['transaction_id']
     list_filter = ['method', 'status']
     readonly_fields = ['created_at', 'updated_at']
+    list_defer_fields = ['raw_payload']
 
 
-@admin.register(Invoice)
-class InvoiceAdmin(admin.ModelAdmin):
+class InvoiceAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['invoice_number', 'booking', 'amount', 'tax_amount', 'issued_at']
+    list_select_related = ['booking__property']
+    raw_id_fields = ['booking']
     search_fields = ['invoice_number']
     list_filter = ['issued_at']
 
 
-@admin.register(Payout)
-class PayoutAdmin(admin.ModelAdmin):
+class PayoutAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['tenant', 'amount', 'status', 'scheduled_at', 'processed_at']
-    list_filter = ['tenant', 'status']
-    date_hierarchy = 'scheduled_at'
+    list_select_related = ['tenant']
+    list_filter = ['tenant', 'status', 'scheduled_at']
 
 
-@admin.register(AuditLog)
-class AuditLogAdmin(admin.ModelAdmin):
+class AuditLogAdmin(DeferredListFieldsAdminMixin, EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['tenant', 'actor', 'action', 'created_at']
+    list_select_related = ['tenant']
     search_fields = ['actor', 'action']
-    list_filter = ['tenant', 'action']
-    date_hierarchy = 'created_at'
+    list_filter = ['tenant', 'action', 'created_at']
     readonly_fields = ['created_at']
+    list_defer_fields = ['details']
+
+
+ADMIN_REGISTRY = [
+    (Country, CountryAdmin),
+    (State, StateAdmin),
+    (District, DistrictAdmin),
+    (Municipality, MunicipalityAdmin),
+    (City, CityAdmin),
+    (Community, CommunityAdmin),
+    (Tenant, TenantAdmin),
+    (TenantUser, TenantUserAdmin),
+    (PropertyType, PropertyTypeAdmin),
+    (Amenity, AmenityAdmin),
+    (Property, PropertyAdmin),
+    (HouseRule, HouseRuleAdmin),
+    (PropertyHouseRule, PropertyHouseRuleAdmin),
+    (RoomType, RoomTypeAdmin),
+    (Room, RoomAdmin),
+    (RatePlan, RatePlanAdmin),
+    (Inventory, InventoryAdmin),
+    (Guest, GuestAdmin),
+    (Booking, BookingAdmin),
+    (Payment, PaymentAdmin),
+    (Invoice, InvoiceAdmin),
+    (Payout, PayoutAdmin),
+    (AuditLog, AuditLogAdmin),
+]
+
+for model, model_admin in ADMIN_REGISTRY:
+    admin.site.register(model, model_admin)
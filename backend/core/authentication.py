@@ -7,6 +7,12 @@ class TenantJWTAuthentication(JWTAuthentication):
     def get_user(self, validated_token):
         user_id = validated_token.get('user_id')
         try:
-            return TenantUser.objects.get(id=user_id)
+            # Permissions and views read request.user.tenant on almost every request;
+            # the hash and token columns are never needed for a token-authenticated request
+            return (
+                TenantUser.objects.select_related('tenant')
+                .defer('password', 'verification_token', 'reset_password_token')
+                .get(id=user_id)
+            )
         except TenantUser.DoesNotExist:
             return None
\ No newline at end of file
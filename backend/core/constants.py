@@ -1,5 +1,6 @@
 # python
 # File: backend/core/constants.py
+from datetime import timedelta
 
 MEDIA_TYPE_CHOICES = (
     ('IMAGE', 'Image'),
@@ -57,10 +58,17 @@ PAYMENT_METHOD_CHOICES = (
     ('WALLET', 'Wallet'),
 )
 
+# Frozen sets of choice values for Python-side membership checks
+OWNER_OR_MANAGER_ROLES = frozenset({'OWNER', 'MANAGER'})
+ACTIVE_BOOKING_STATUSES = frozenset({'PENDING', 'CONFIRMED', 'CHECKED_IN'})
+
 DEFAULT_TIMEZONE = 'Asia/Kathmandu'
 DEFAULT_CURRENCY = 'NPR'
 PRICING_MODEL_STATIC = 'STATIC'
 
+# Logins closer together than this don't rewrite last_login
+LAST_LOGIN_UPDATE_INTERVAL = timedelta(minutes=1)
+
 __all__ = [
     'MEDIA_TYPE_CHOICES',
     'ROLE_CHOICES',
@@ -70,7 +78,10 @@ __all__ = [
     'BOOKING_STATUS_CHOICES',
     'PAYMENT_STATUS_CHOICES',
     'PAYMENT_METHOD_CHOICES',
+    'OWNER_OR_MANAGER_ROLES',
+    'ACTIVE_BOOKING_STATUSES',
     'DEFAULT_TIMEZONE',
     'DEFAULT_CURRENCY',
     'PRICING_MODEL_STATIC',
+    'LAST_LOGIN_UPDATE_INTERVAL',
 ]
\ No newline at end of file
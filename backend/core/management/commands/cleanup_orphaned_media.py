@@ -16,9 +16,13 @@ Usage:
     
     # Custom batch size
     python manage.py cleanup_orphaned_media --batch-size 50
+    
+    # Delete files with 16 threads
+    python manage.py cleanup_orphaned_media --workers 16
 """
 from django.core.management.base import BaseCommand
 from config.utils.media_cleanup import (
+    CLEANUP_MAX_WORKERS,
     cleanup_orphaned_media,
     identify_orphaned_media,
     get_media_statistics
@@ -46,6 +50,12 @@ class Command(BaseCommand):
             default=100,
             help='Number of records to process in each batch (default: 100)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=CLEANUP_MAX_WORKERS,
+            help=f'Number of threads deleting files concurrently (default: {CLEANUP_MAX_WORKERS})',
+        )
         parser.add_argument(
             '--stats-only',
             action='store_true',
@@ -56,6 +66,7 @@ class Command(BaseCommand):
         dry_run = options['dry_run']
         grace_period = options['grace_period']
         batch_size = options['batch_size']
+        workers = options['workers']
         stats_only = options['stats_only']
 
         self.stdout.write(self.style.HTTP_INFO('=' * 70))
@@ -100,7 +111,8 @@ class Command(BaseCommand):
         result = cleanup_orphaned_media(
             grace_period_hours=grace_period,
             dry_run=dry_run,
-            batch_size=batch_size
+            batch_size=batch_size,
+            max_workers=workers
         )
         
         # Display results
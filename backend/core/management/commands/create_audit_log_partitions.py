@@ -0,0 +1,53 @@
+"""
+Management command to create upcoming monthly partitions of audit_logs.
+
+entrypoint.sh runs it on every startup, and it creates a year ahead so
+rows never land in the default partition (which would block creating
+that month's partition) even between infrequent deploys.
+
+Usage:
+    # Current month plus the next 12 (default)
+    python manage.py create_audit_log_partitions
+
+    # Current month plus the next 6
+    python manage.py create_audit_log_partitions --months 6
+"""
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+
+def _add_months(month_start, months):
+    year, month = divmod(month_start.month - 1 + months, 12)
+    return month_start.replace(year=month_start.year + year, month=month + 1)
+
+
+class Command(BaseCommand):
+    help = 'Create monthly audit_logs partitions ahead of time'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months',
+            type=int,
+            default=12,
+            help='Number of months ahead of the current one to create (default: 12)',
+        )
+
+    def handle(self, *args, **options):
+        now = datetime.now(timezone.utc)
+        current = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+        with connection.cursor() as cursor:
+            for offset in range(options['months'] + 1):
+                start = _add_months(current, offset)
+                end = _add_months(start, 1)
+                name = f"audit_logs_{start:%Y_%m}"
+                cursor.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF audit_logs '
+                    'FOR VALUES FROM (%s) TO (%s)',
+                    [start, end],
+                )
+                self.stdout.write(f'{name}: {start:%Y-%m-%d} .. {end:%Y-%m-%d}')
+
+        self.stdout.write(self.style.SUCCESS('Audit log partitions are in place'))
@@ -1,10 +1,53 @@
 import csv
+import io
 import json
+import mmap
 import os
+import sys
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, reset_queries, transaction
 from core.models import Country, State, District, Municipality
 
+try:
+    # Optional: several times faster than the stdlib decoder for the combined file
+    import orjson
+except ImportError:
+    orjson = None
+
+BULK_BATCH_SIZE = 500
+COPY_NULL = '\\N'
+
+# Alternative keys an input row may use for each value, in order of preference
+JSON_NAME_KEYS = ('title_en', 'title', 'name')
+JSON_CODE_KEYS = ('muni_code', 'll_id', 'code')
+STATE_KEYS = ('state', 'state_name', 'province')
+DISTRICT_KEYS = ('district', 'district_name', 'name')
+MUNI_DISTRICT_KEYS = ('district', 'district_name', 'district_raw')
+MUNI_NAME_KEYS = ('municipality', 'municipality_name', 'name')
+MUNI_CODE_KEYS = ('muni_code', 'code')
+
+
+def _clean(value):
+    """Strip and intern string values; empty values become None."""
+    if isinstance(value, str):
+        value = value.strip()
+        return sys.intern(value) if value else None
+    return value or None
+
+
+def _normalize(name):
+    """Case- and whitespace-insensitive key for matching location names exactly."""
+    return ' '.join(name.split()).casefold()
+
+
+def _pick(row, keys):
+    """Return the first truthy value of `keys` in `row`, cleaned."""
+    for key in keys:
+        value = row.get(key)
+        if value:
+            return _clean(value)
+    return None
+
 
 class Command(BaseCommand):
     help = 'Seed Nepal country, states (provinces). Optionally load districts and municipalities from CSV or JSON.'
@@ -21,158 +64,265 @@ class Command(BaseCommand):
         use_json = options.get('use_json')
         force = options.get('force')
 
-        with transaction.atomic():
-            nepal, created = Country.objects.get_or_create(name='Nepal', defaults={'code': 'NP'})
-            if created:
-                self.stdout.write(self.style.SUCCESS('Created country: Nepal'))
-            else:
-                self.stdout.write('Country Nepal already exists')
-
-            # If force, remove states/districts/municipalities tied to Nepal
-            if force:
-                State.objects.filter(country=nepal).delete()
-                District.objects.filter(state__country=nepal).delete()
-                Municipality.objects.filter(district__state__country=nepal).delete()
-                self.stdout.write(self.style.WARNING('Existing Nepal location data deleted'))
-
-            # Nepal provinces (7) - keep as fallback in case JSON not provided
-            provinces = [
-                'Province No. 1',
-                'Madhesh Province',
-                'Bagmati Province',
-                'Gandaki Province',
-                'Lumbini Province',
-                'Karnali Province',
-                'Sudurpashchim Province',
-            ]
-
-            # If using combined JSON, prefer that path
-            if use_json:
-                self._load_from_json(nepal, use_json)
-            else:
-                for name in provinces:
-                    state, screated = State.objects.get_or_create(country=nepal, name=name)
-                    if screated:
-                        self.stdout.write(self.style.SUCCESS(f'Created state: {name}'))
-
-                # Optionally load districts
-                if load_districts:
-                    self._load_districts(nepal, load_districts)
-
-                # Optionally load municipalities
-                if load_municipalities:
-                    self._load_municipalities(nepal, load_municipalities)
-
-            self.stdout.write(self.style.SUCCESS('Seeding complete'))
+        nepal, created = Country.objects.get_or_create(name='Nepal', defaults={'code': 'NP'})
+        if created:
+            self.stdout.write(self.style.SUCCESS('Created country: Nepal'))
+        else:
+            self.stdout.write('Country Nepal already exists')
 
-    def _load_districts(self, country, path):
-        path = os.path.abspath(path)
-        if not os.path.exists(path):
-            raise CommandError(f'Districts file not found: {path}')
+        # Each phase commits on its own, keeping transactions and lock times short
+        # If force, remove states/districts/municipalities tied to Nepal
+        if force:
+            # Districts and municipalities cascade from their state
+            State.objects.filter(country=nepal).delete()
+            self._end_phase()
+            self.stdout.write(self.style.WARNING('Existing Nepal location data deleted'))
 
-        ext = os.path.splitext(path)[1].lower()
-        items = []
-        if ext == '.csv':
-            with open(path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Expecting columns: state_name,district_name,code?
-                    items.append(row)
-        elif ext in ('.json', '.ndjson'):
-            with open(path, encoding='utf-8') as f:
-                items = json.load(f)
+        # Nepal provinces (7) - keep as fallback in case JSON not provided
+        provinces = [
+            'Province No. 1',
+            'Madhesh Province',
+            'Bagmati Province',
+            'Gandaki Province',
+            'Lumbini Province',
+            'Karnali Province',
+            'Sudurpashchim Province',
+        ]
+
+        # If using combined JSON, prefer that path
+        if use_json:
+            self._load_from_json(nepal, use_json)
+            self._end_phase()
         else:
-            raise CommandError('Unsupported file type for districts; use CSV or JSON')
+            with transaction.atomic():
+                _, created_states = self._create_missing(
+                    State, 'country_id', {(nepal.id, name): {} for name in provinces}, State.objects.filter(country=nepal)
+                )
+            self._end_phase()
+            if created_states:
+                self.stdout.write(self.style.SUCCESS(f'Created states: {created_states}'))
+
+            # Optionally load districts
+            if load_districts:
+                self._load_districts(nepal, load_districts)
+                self._end_phase()
+
+            # Optionally load municipalities
+            if load_municipalities:
+                self._load_municipalities(nepal, load_municipalities)
+                self._end_phase()
 
-        created = 0
-        for row in items:
-            state_name = row.get('state') or row.get('state_name') or row.get('province')
-            district_name = row.get('district') or row.get('district_name') or row.get('name')
+        self.stdout.write(self.style.SUCCESS('Seeding complete'))
+
+    def _end_phase(self):
+        """
+        Drop the query log kept under DEBUG and close the connection after a phase,
+        so long imports don't accumulate memory in Python or in the backend process.
+        The connection is kept when a caller wrapped the command in a transaction.
+        """
+        reset_queries()
+        if not connection.in_atomic_block:
+            connection.close()
+
+    @transaction.atomic
+    def _load_districts(self, country, path):
+        # Expecting columns: state_name,district_name,code?
+        rows = self._read_rows(path, 'districts', (STATE_KEYS, DISTRICT_KEYS))
+
+        # Collect the wanted (state_id, name) pairs in file order, without duplicates
+        states = {_normalize(state.name): state for state in State.objects.filter(country=country).only('id', 'name')}
+        wanted = {}
+        unmatched = []
+        for state_name, district_name in rows:
             if not state_name or not district_name:
                 continue
-            state = State.objects.filter(country=country, name__icontains=state_name).first()
+            state = states.get(_normalize(state_name))
             if not state:
-                self.stdout.write(self.style.ERROR(f'State not found for district row: {state_name}'))
+                unmatched.append(f'State not found for district row: {state_name}')
                 continue
-            d, dcreated = District.objects.get_or_create(state=state, name=district_name)
-            if dcreated:
-                created += 1
+            wanted.setdefault((state.id, district_name), {})
+
+        # Report unmatched rows with a single write instead of one per row
+        if unmatched:
+            self.stdout.write(self.style.ERROR('\n'.join(unmatched)))
+
+        existing = District.objects.filter(state__country=country)
+        _, created = self._create_missing(District, 'state_id', wanted, existing)
         self.stdout.write(self.style.SUCCESS(f'Imported {created} districts'))
 
+    @transaction.atomic
     def _load_municipalities(self, country, path):
-        path = os.path.abspath(path)
-        if not os.path.exists(path):
-            raise CommandError(f'Municipalities file not found: {path}')
+        # Expecting columns: district_name,municipality_name,code?
+        rows = self._read_rows(path, 'municipalities', (MUNI_DISTRICT_KEYS, MUNI_NAME_KEYS, MUNI_CODE_KEYS))
 
-        ext = os.path.splitext(path)[1].lower()
-        items = []
-        if ext == '.csv':
-            with open(path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Expecting columns: district_name,municipality_name,code?
-                    items.append(row)
-        elif ext in ('.json', '.ndjson'):
-            with open(path, encoding='utf-8') as f:
-                items = json.load(f)
-        else:
-            raise CommandError('Unsupported file type for municipalities; use CSV or JSON')
-
-        created = 0
-        for row in items:
-            district_name = row.get('district') or row.get('district_name') or row.get('district_raw')
-            municipality_name = row.get('municipality') or row.get('municipality_name') or row.get('name')
-            code = row.get('muni_code') or row.get('code')
+        # Collect the wanted (district_id, name) pairs in file order, without duplicates
+        districts = {
+            _normalize(district.name): district
+            for district in District.objects.filter(state__country=country).only('id', 'name')
+        }
+        wanted = {}
+        unmatched = []
+        for district_name, municipality_name, code in rows:
             if not district_name or not municipality_name:
                 continue
-            district = District.objects.filter(name__icontains=district_name, state__country=country).first()
+            district = districts.get(_normalize(district_name))
             if not district:
-                self.stdout.write(self.style.ERROR(f'District not found for municipality row: {district_name}'))
+                unmatched.append(f'District not found for municipality row: {district_name}')
                 continue
-            m, mcreated = Municipality.objects.get_or_create(district=district, name=municipality_name, defaults={'code': code})
-            if mcreated:
-                created += 1
-        self.stdout.write(self.style.SUCCESS(f'Imported {created} municipalities'))
+            wanted.setdefault((district.id, municipality_name), {'code': code})
+
+        if unmatched:
+            self.stdout.write(self.style.ERROR('\n'.join(unmatched)))
+
+        upserted = self._upsert_municipalities(wanted)
+        self.stdout.write(self.style.SUCCESS(f'Upserted {upserted} municipalities'))
 
+    @transaction.atomic
     def _load_from_json(self, country, path):
         path = os.path.abspath(path)
         if not os.path.exists(path):
             raise CommandError(f'JSON file not found: {path}')
 
-        with open(path, encoding='utf-8') as f:
+        # Parse straight from the page cache instead of reading into a bytes copy first
+        with open(path, 'rb') as f:
             try:
-                data = json.load(f)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = orjson.loads(view) if orjson else json.loads(view.tobytes())
             except Exception as e:
                 raise CommandError(f'Failed to parse JSON: {e}')
 
-        created_states = 0
-        created_districts = 0
-        created_munis = 0
-
+        # Collect every level first, keyed by (parent, name), in file order
+        wanted_states = {}
+        wanted_districts = {}
+        wanted_munis = {}
         for province in data:
             # province name: try English title, else Nepali title
-            p_name = province.get('title_en') or province.get('title') or province.get('name')
+            p_name = _pick(province, JSON_NAME_KEYS)
             if not p_name:
                 continue
-            state, screated = State.objects.get_or_create(country=country, name=p_name)
-            if screated:
-                created_states += 1
+            wanted_states[(country.id, p_name)] = {}
 
             for district in province.get('districts', []):
-                d_name = district.get('title_en') or district.get('title') or district.get('name')
+                d_name = _pick(district, JSON_NAME_KEYS)
                 if not d_name:
                     continue
-                d, dcreated = District.objects.get_or_create(state=state, name=d_name)
-                if dcreated:
-                    created_districts += 1
+                wanted_districts.setdefault((p_name, d_name), {})
 
                 for ll in district.get('local_levels', []) or []:
-                    m_name = ll.get('title_en') or ll.get('title') or ll.get('name')
-                    m_code = ll.get('muni_code') or ll.get('ll_id') or ll.get('code')
+                    m_name = _pick(ll, JSON_NAME_KEYS)
+                    m_code = _pick(ll, JSON_CODE_KEYS)
                     if not m_name:
                         continue
-                    m, mcreated = Municipality.objects.get_or_create(district=d, name=m_name, defaults={'code': m_code})
-                    if mcreated:
-                        created_munis += 1
+                    wanted_munis.setdefault((p_name, d_name, m_name), {'code': m_code})
+
+        # Then create each level with one SELECT and batched INSERTs
+        state_ids, created_states = self._create_missing(
+            State, 'country_id', wanted_states, State.objects.filter(country=country)
+        )
+        district_ids, created_districts = self._create_missing(
+            District,
+            'state_id',
+            {(state_ids[(country.id, p_name)], d_name): defaults for (p_name, d_name), defaults in wanted_districts.items()},
+            District.objects.filter(state__country=country),
+        )
+        upserted_munis = self._upsert_municipalities({
+            (district_ids[(state_ids[(country.id, p_name)], d_name)], m_name): defaults
+            for (p_name, d_name, m_name), defaults in wanted_munis.items()
+        })
+
+        self.stdout.write(self.style.SUCCESS(f'Imported states: {created_states}, districts: {created_districts}; upserted municipalities: {upserted_munis}'))
+
+    def _read_rows(self, path, label, columns):
+        """
+        Validate a CSV/JSON input file and return an iterator of value tuples,
+        one value per entry of `columns` (a tuple of alternative keys each).
+        CSV rows are streamed from the reader instead of being staged in a list.
+        """
+        path = os.path.abspath(path)
+        if not os.path.exists(path):
+            raise CommandError(f'{label.capitalize()} file not found: {path}')
+
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.csv':
+            return self._iter_csv(path, columns)
+        if ext in ('.json', '.ndjson'):
+            with open(path, encoding='utf-8') as f:
+                items = json.load(f)
+            return (tuple(_pick(item, keys) for keys in columns) for item in items)
+        raise CommandError(f'Unsupported file type for {label}; use CSV or JSON')
+
+    def _iter_csv(self, path, columns):
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            # Resolve each column to a fixed index once, from the first matching header
+            header = next(reader, [])
+            indices = [next((header.index(key) for key in keys if key in header), None) for keys in columns]
+            for row in reader:
+                yield tuple(
+                    _clean(row[index]) if index is not None and index < len(row) else None
+                    for index in indices
+                )
+
+    def _upsert_municipalities(self, wanted):
+        """
+        Insert or refresh municipalities ({(district_id, name): {'code': ...}}) with
+        INSERT ... ON CONFLICT (district_id, name) DO UPDATE, without reading existing rows.
+        Rows without a code only insert, so re-seeding never clears an existing code.
+        Returns the number of rows upserted.
+        """
+        with_code, without_code = [], []
+        for (district_id, name), defaults in wanted.items():
+            municipality = Municipality(district_id=district_id, name=name, **defaults)
+            (with_code if municipality.code else without_code).append(municipality)
+        Municipality.objects.bulk_create(
+            with_code,
+            batch_size=BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['district', 'name'],
+            update_fields=['code', 'updated_at'],
+        )
+        Municipality.objects.bulk_create(without_code, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+        return len(with_code) + len(without_code)
+
+    def _create_missing(self, model, parent_field, wanted, existing):
+        """
+        Bulk-create the rows of `wanted` ({(parent_id, name): defaults}) that are not
+        in the `existing` queryset, reading the existing rows with a single SELECT.
+        Returns the {(parent_id, name): id} map of all wanted rows and the number created.
+        """
+        ids = {(parent_id, name): pk for pk, parent_id, name in existing.values_list('id', parent_field, 'name')}
+        to_create = [
+            model(**{parent_field: parent_id, 'name': name, **defaults})
+            for (parent_id, name), defaults in wanted.items()
+            if (parent_id, name) not in ids
+        ]
+        if connection.vendor == 'postgresql':
+            self._copy_insert(model, to_create)
+        else:
+            model.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+        # Primary keys are UUIDs generated in Python, so created rows need no refetch
+        ids.update({(getattr(obj, parent_field), obj.name): obj.pk for obj in to_create})
+        return ids, len(to_create)
+
+    def _copy_insert(self, model, objs):
+        """
+        Insert objs with a single COPY ... FROM STDIN instead of batched INSERTs.
+        Values are prepared like bulk_create does (pre_save fills auto_now fields).
+        """
+        if not objs:
+            return
+        fields = model._meta.concrete_fields
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for obj in objs:
+            row = []
+            for field in fields:
+                value = field.get_db_prep_save(field.pre_save(obj, True), connection)
+                row.append(COPY_NULL if value is None else value)
+            writer.writerow(row)
+        buffer.seek(0)
 
-        self.stdout.write(self.style.SUCCESS(f'Imported states: {created_states}, districts: {created_districts}, municipalities: {created_munis}'))
+        table = connection.ops.quote_name(model._meta.db_table)
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')", buffer)
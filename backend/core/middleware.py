@@ -1,20 +1,20 @@
 """
 Middleware for tenant-based multi-tenancy
 """
-import threading
+from contextvars import ContextVar
 
-# Thread-local storage for tenant context
-_thread_locals = threading.local()
+# Per-request tenant context; isolated per thread and per async task
+_current_tenant = ContextVar('current_tenant', default=None)
 
 
 def get_current_tenant():
-    """Get the current tenant from thread-local storage"""
-    return getattr(_thread_locals, 'tenant', None)
+    """Get the current tenant from the request context"""
+    return _current_tenant.get()
 
 
 def set_current_tenant(tenant):
-    """Set the current tenant in thread-local storage"""
-    _thread_locals.tenant = tenant
+    """Set the current tenant in the request context and return the reset token"""
+    return _current_tenant.set(tenant)
 
 
 class TenantMiddleware:
@@ -35,9 +35,9 @@ class TenantMiddleware:
         tenant_id = request.headers.get('X-Tenant-Id')
         
         # Try to get tenant from authenticated user
-        if hasattr(request, 'user') and request.user.is_authenticated:
-            if hasattr(request.user, 'tenant'):
-                tenant = request.user.tenant
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            tenant = getattr(user, 'tenant', None)
         
         # If tenant_id is provided in header, validate it
         if tenant_id and tenant:
@@ -45,15 +45,14 @@ class TenantMiddleware:
                 # Mismatch between user's tenant and requested tenant
                 tenant = None
         
-        # Set tenant in thread-local storage
-        set_current_tenant(tenant)
+        # Set tenant in the request context
+        token = _current_tenant.set(tenant)
         
         # Store tenant in request for easy access
         request.tenant = tenant
         
-        response = self.get_response(request)
-        
-        # Clean up thread-local storage
-        set_current_tenant(None)
-        
-        return response
+        try:
+            return self.get_response(request)
+        finally:
+            # Restore the previous context, even when the view raises
+            _current_tenant.reset(token)
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.8 on 2026-10-16 09:00
+
+import os
+
+from django.db import migrations, models
+
+
+def backfill_size_bytes(apps, schema_editor):
+    Multimedia = apps.get_model('core', 'Multimedia')
+    pending = []
+    for media in Multimedia.objects.exclude(file='').only('id', 'file').iterator(chunk_size=500):
+        try:
+            media.size_bytes = os.path.getsize(media.file.path)
+        except (OSError, ValueError):
+            continue
+        pending.append(media)
+        if len(pending) >= 500:
+            Multimedia.objects.bulk_update(pending, ['size_bytes'])
+            pending = []
+    if pending:
+        Multimedia.objects.bulk_update(pending, ['size_bytes'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_houserule_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='multimedia',
+            name='size_bytes',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_size_bytes, migrations.RunPython.noop),
+    ]
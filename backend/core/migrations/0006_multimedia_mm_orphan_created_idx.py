@@ -0,0 +1,17 @@
+# Generated by Django 4.2.8 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_multimedia_size_bytes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='multimedia',
+            index=models.Index(condition=models.Q(('content_type__isnull', True), ('object_id__isnull', True)), fields=['created_at'], name='mm_orphan_created_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.8 on 2026-10-16 10:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0006_multimedia_mm_orphan_created_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='multimedia',
+            index=models.Index(fields=['content_type', 'object_id', 'field_name'], name='mm_owner_field_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='room',
+            index=models.Index(fields=['room_type', 'status'], name='room_type_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(fields=['tenant', 'status', 'checkin'], name='booking_tenant_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(fields=['property', 'status', 'checkin'], name='booking_property_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(fields=['room', 'status', 'checkin', 'checkout'], name='booking_room_dates_idx'),
+        ),
+    ]
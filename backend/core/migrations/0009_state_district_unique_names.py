@@ -0,0 +1,21 @@
+# Generated by Django 4.2.8 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='state',
+            constraint=models.UniqueConstraint(fields=('country', 'name'), name='state_country_name_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='district',
+            constraint=models.UniqueConstraint(fields=('state', 'name'), name='district_state_name_uniq'),
+        ),
+    ]
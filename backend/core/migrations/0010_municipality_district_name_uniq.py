@@ -0,0 +1,17 @@
+# Generated by Django 4.2.8 on 2026-10-16 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_state_district_unique_names'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='municipality',
+            constraint=models.UniqueConstraint(fields=('district', 'name'), name='municipality_district_name_uniq'),
+        ),
+    ]
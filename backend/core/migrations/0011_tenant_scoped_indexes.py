@@ -0,0 +1,36 @@
+# Generated by Django 4.2.8 on 2026-10-16 14:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0010_municipality_district_name_uniq'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='tenantuser',
+            index=models.Index(fields=['tenant', 'role'], name='tenant_user_role_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='property',
+            index=models.Index(fields=['tenant', 'status'], name='property_tenant_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='inventory',
+            index=models.Index(fields=['room_type', 'dt'], include=['available_count', 'blocked_count'], name='inventory_room_dt_cover_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(fields=['tenant', 'checkin', 'checkout'], name='booking_tenant_dates_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status__in', ['CHECKED_IN', 'CONFIRMED', 'PENDING'])), fields=['tenant', 'checkin', 'checkout'], name='booking_active_idx'),
+        ),
+    ]
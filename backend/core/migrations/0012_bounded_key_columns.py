@@ -0,0 +1,38 @@
+# Generated by Django 4.2.8 on 2026-10-16 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_tenant_scoped_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tenantapikey',
+            name='key',
+            field=models.CharField(max_length=128, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='idempotencykey',
+            name='key',
+            field=models.CharField(max_length=128, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='inventoryhold',
+            name='hold_token',
+            field=models.CharField(max_length=64, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='external_id',
+            field=models.CharField(blank=True, max_length=128, null=True),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='hold_token',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
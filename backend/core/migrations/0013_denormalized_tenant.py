@@ -0,0 +1,48 @@
+# Generated by Django 4.2.8 on 2026-10-16 15:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+BACKFILL_SQL = """
+UPDATE room_types AS rt SET tenant_id = p.tenant_id
+FROM properties AS p WHERE rt.property_id = p.id;
+
+UPDATE rooms AS r SET tenant_id = rt.tenant_id
+FROM room_types AS rt WHERE r.room_type_id = rt.id;
+
+UPDATE rate_plans AS rp SET tenant_id = p.tenant_id
+FROM properties AS p WHERE rp.property_id = p.id;
+
+UPDATE inventory AS i SET tenant_id = rt.tenant_id
+FROM room_types AS rt WHERE i.room_type_id = rt.id;
+"""
+
+TENANT_MODELS = ['roomtype', 'room', 'rateplan', 'inventory']
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_bounded_key_columns'),
+    ]
+
+    operations = [
+        *(
+            migrations.AddField(
+                model_name=model_name,
+                name='tenant',
+                field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.tenant'),
+            )
+            for model_name in TENANT_MODELS
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+        *(
+            migrations.AlterField(
+                model_name=model_name,
+                name='tenant',
+                field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.tenant'),
+            )
+            for model_name in TENANT_MODELS
+        ),
+    ]
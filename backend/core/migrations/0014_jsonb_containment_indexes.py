@@ -0,0 +1,25 @@
+# Generated by Django 4.2.8 on 2026-10-16 15:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0013_denormalized_tenant'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='tenantapikey',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['scopes'], name='apikey_scopes_gin', opclasses=['jsonb_path_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='webhookregistration',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['events'], name='webhook_events_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
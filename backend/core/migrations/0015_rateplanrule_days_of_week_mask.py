@@ -0,0 +1,51 @@
+# Generated by Django 4.2.8 on 2026-10-16 16:00
+
+from django.db import migrations, models
+
+
+ALL_DAYS_MASK = 0b1111111
+
+
+def pack_days_of_week(apps, schema_editor):
+    RatePlanRule = apps.get_model('core', 'RatePlanRule')
+    pending = []
+    for rule in RatePlanRule.objects.only('id', 'days_of_week').iterator(chunk_size=500):
+        if not rule.days_of_week:
+            continue
+        mask = 0
+        for day in rule.days_of_week:
+            mask |= 1 << ((int(day) - 1) % 7)
+        rule.days_of_week_mask = mask
+        pending.append(rule)
+    RatePlanRule.objects.bulk_update(pending, ['days_of_week_mask'], batch_size=500)
+
+
+def unpack_days_of_week(apps, schema_editor):
+    RatePlanRule = apps.get_model('core', 'RatePlanRule')
+    pending = []
+    for rule in RatePlanRule.objects.only('id', 'days_of_week_mask').iterator(chunk_size=500):
+        if rule.days_of_week_mask == ALL_DAYS_MASK:
+            continue
+        rule.days_of_week = [day for day in range(1, 8) if rule.days_of_week_mask >> (day - 1) & 1]
+        pending.append(rule)
+    RatePlanRule.objects.bulk_update(pending, ['days_of_week'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_jsonb_containment_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rateplanrule',
+            name='days_of_week_mask',
+            field=models.PositiveSmallIntegerField(default=127),
+        ),
+        migrations.RunPython(pack_days_of_week, unpack_days_of_week),
+        migrations.RemoveField(
+            model_name='rateplanrule',
+            name='days_of_week',
+        ),
+    ]
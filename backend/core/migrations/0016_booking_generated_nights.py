@@ -0,0 +1,37 @@
+# Generated by Django 4.2.8 on 2026-10-16 16:30
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_rateplanrule_days_of_week_mask'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                ALTER TABLE bookings
+                    DROP COLUMN nights,
+                    ADD COLUMN nights integer GENERATED ALWAYS AS (checkout - checkin) STORED;
+            """,
+            reverse_sql="""
+                ALTER TABLE bookings DROP COLUMN nights, ADD COLUMN nights integer;
+                UPDATE bookings SET nights = checkout - checkin;
+                ALTER TABLE bookings ALTER COLUMN nights SET NOT NULL;
+            """,
+            state_operations=[
+                migrations.AlterField(
+                    model_name='booking',
+                    name='nights',
+                    field=core.models.GeneratedIntegerField(),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['tenant', 'nights'], name='booking_tenant_nights_idx'),
+        ),
+    ]
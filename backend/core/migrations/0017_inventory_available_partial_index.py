@@ -0,0 +1,24 @@
+# Generated by Django 4.2.8 on 2026-10-16 17:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0016_booking_generated_nights'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='inventory',
+            index=models.Index(condition=models.Q(('available_count__gt', models.F('blocked_count'))), fields=['room_type', 'dt'], include=['available_count', 'blocked_count'], name='inv_avail_partial'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='inventory',
+            name='inventory_room_dt_cover_idx',
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 4.2.8 on 2026-10-16 17:30
+
+from django.db import migrations
+
+
+PARTITION_SQL = """
+ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned;
+
+CREATE TABLE audit_logs (
+    id bigint GENERATED BY DEFAULT AS IDENTITY,
+    actor text NULL,
+    action text NULL,
+    details jsonb NULL,
+    created_at timestamp with time zone NOT NULL,
+    tenant_id uuid NULL REFERENCES tenants (id) DEFERRABLE INITIALLY DEFERRED,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE INDEX audit_logs_tenant_id_idx ON audit_logs (tenant_id);
+
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+DO $$
+DECLARE
+    month_start timestamptz;
+BEGIN
+    FOR i IN 0..2 LOOP
+        month_start := date_trunc('month', now()) + make_interval(months => i);
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            'audit_logs_' || to_char(month_start, 'YYYY_MM'),
+            month_start,
+            month_start + interval '1 month'
+        );
+    END LOOP;
+END $$;
+
+INSERT INTO audit_logs (id, actor, action, details, created_at, tenant_id)
+SELECT id, actor, action, details, created_at, tenant_id FROM audit_logs_unpartitioned;
+
+SELECT setval(
+    pg_get_serial_sequence('audit_logs', 'id'),
+    COALESCE((SELECT max(id) FROM audit_logs), 0) + 1,
+    false
+);
+
+DROP TABLE audit_logs_unpartitioned;
+"""
+
+UNPARTITION_SQL = """
+ALTER TABLE audit_logs RENAME TO audit_logs_partitioned;
+
+CREATE TABLE audit_logs (
+    id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    actor text NULL,
+    action text NULL,
+    details jsonb NULL,
+    created_at timestamp with time zone NOT NULL,
+    tenant_id uuid NULL REFERENCES tenants (id) DEFERRABLE INITIALLY DEFERRED
+);
+
+INSERT INTO audit_logs (id, actor, action, details, created_at, tenant_id)
+SELECT id, actor, action, details, created_at, tenant_id FROM audit_logs_partitioned;
+
+SELECT setval(
+    pg_get_serial_sequence('audit_logs', 'id'),
+    COALESCE((SELECT max(id) FROM audit_logs), 0) + 1,
+    false
+);
+
+DROP TABLE audit_logs_partitioned CASCADE;
+
+CREATE INDEX audit_logs_tenant_id_idx ON audit_logs (tenant_id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_inventory_available_partial_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(PARTITION_SQL, UNPARTITION_SQL),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.8 on 2026-10-16 18:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_partition_audit_logs'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                'ALTER TABLE audit_logs ALTER COLUMN details SET COMPRESSION lz4;',
+                'ALTER TABLE payments ALTER COLUMN raw_payload SET COMPRESSION lz4;',
+            ],
+            reverse_sql=[
+                'ALTER TABLE audit_logs ALTER COLUMN details SET COMPRESSION default;',
+                'ALTER TABLE payments ALTER COLUMN raw_payload SET COMPRESSION default;',
+            ],
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.8 on 2026-10-16 18:30
+
+import core.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_lz4_payload_compression'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                UPDATE properties SET lat = ST_Y(geom), lon = ST_X(geom)
+                WHERE geom IS NOT NULL AND (lat IS NULL OR lon IS NULL);
+
+                ALTER TABLE properties
+                    DROP COLUMN geom,
+                    ADD COLUMN geom geometry(Point, 4326)
+                        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(lon, lat), 4326)) STORED;
+
+                CREATE INDEX properties_geom_id ON properties USING GIST (geom);
+            """,
+            reverse_sql="""
+                ALTER TABLE properties DROP COLUMN geom, ADD COLUMN geom geometry(Point, 4326) NULL;
+                UPDATE properties SET geom = ST_SetSRID(ST_MakePoint(lon, lat), 4326)
+                WHERE lat IS NOT NULL AND lon IS NOT NULL;
+                CREATE INDEX properties_geom_id ON properties USING GIST (geom);
+            """,
+            state_operations=[
+                migrations.AlterField(
+                    model_name='property',
+                    name='geom',
+                    field=core.models.GeneratedPointField(blank=True, null=True, srid=4326),
+                ),
+            ],
+        ),
+    ]
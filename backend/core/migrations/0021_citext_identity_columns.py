@@ -0,0 +1,36 @@
+# Generated by Django 4.2.8 on 2026-10-16 19:00
+
+import core.models
+from django.contrib.postgres.operations import CITextExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_property_generated_geom'),
+    ]
+
+    operations = [
+        CITextExtension(),
+        migrations.AlterField(
+            model_name='tenant',
+            name='contact_email',
+            field=core.models.CITextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='tenantuser',
+            name='user_name',
+            field=core.models.CITextField(unique=True),
+        ),
+        migrations.AlterField(
+            model_name='tenantuser',
+            name='email',
+            field=core.models.CITextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='guest',
+            name='email',
+            field=core.models.CITextField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.8 on 2026-10-16 19:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_citext_identity_columns'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.UniqueConstraint(deferrable=models.Deferrable['DEFERRED'], fields=('tenant', 'external_id'), name='booking_ext_uniq'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.8 on 2026-10-16 20:00
+
+import core.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_booking_ext_uniq'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE TYPE booking_status AS ENUM (
+                    'PENDING', 'CONFIRMED', 'CANCELLED', 'CHECKED_IN', 'CHECKED_OUT', 'NO_SHOW'
+                );
+                CREATE TYPE payment_status AS ENUM ('PENDING', 'PAID', 'FAILED', 'REFUNDED');
+
+                -- The partial index predicate compares status with text literals; rebuild it
+                DROP INDEX booking_active_idx;
+
+                ALTER TABLE bookings
+                    ALTER COLUMN status TYPE booking_status USING status::booking_status,
+                    ALTER COLUMN payment_status TYPE payment_status USING payment_status::payment_status;
+                ALTER TABLE payments
+                    ALTER COLUMN status TYPE payment_status USING status::payment_status;
+
+                CREATE INDEX booking_active_idx ON bookings (tenant_id, checkin, checkout)
+                    WHERE status IN ('CHECKED_IN', 'CONFIRMED', 'PENDING');
+            """,
+            reverse_sql="""
+                DROP INDEX booking_active_idx;
+
+                ALTER TABLE bookings
+                    ALTER COLUMN status TYPE varchar(20) USING status::text,
+                    ALTER COLUMN payment_status TYPE varchar(20) USING payment_status::text;
+                ALTER TABLE payments
+                    ALTER COLUMN status TYPE varchar(20) USING status::text;
+
+                DROP TYPE booking_status;
+                DROP TYPE payment_status;
+
+                CREATE INDEX booking_active_idx ON bookings (tenant_id, checkin, checkout)
+                    WHERE status IN ('CHECKED_IN', 'CONFIRMED', 'PENDING');
+            """,
+            state_operations=[
+                migrations.AlterField(
+                    model_name='booking',
+                    name='status',
+                    field=core.models.PgEnumField(choices=[('PENDING', 'Pending'), ('CONFIRMED', 'Confirmed'), ('CANCELLED', 'Cancelled'), ('CHECKED_IN', 'Checked In'), ('CHECKED_OUT', 'Checked Out'), ('NO_SHOW', 'No Show')], default='PENDING', enum_type='booking_status', max_length=20),
+                ),
+                migrations.AlterField(
+                    model_name='booking',
+                    name='payment_status',
+                    field=core.models.PgEnumField(choices=[('PENDING', 'Pending'), ('PAID', 'Paid'), ('FAILED', 'Failed'), ('REFUNDED', 'Refunded')], default='PENDING', enum_type='payment_status', max_length=20),
+                ),
+                migrations.AlterField(
+                    model_name='payment',
+                    name='status',
+                    field=core.models.PgEnumField(choices=[('PENDING', 'Pending'), ('PAID', 'Paid'), ('FAILED', 'Failed'), ('REFUNDED', 'Refunded')], default='PENDING', enum_type='payment_status', max_length=20),
+                ),
+            ],
+        ),
+    ]
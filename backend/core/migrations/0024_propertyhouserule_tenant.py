@@ -0,0 +1,31 @@
+# Generated by Django 4.2.8 on 2026-10-16 20:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_status_enum_types'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertyhouserule',
+            name='tenant',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.tenant'),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE property_house_rules AS phr SET tenant_id = p.tenant_id
+            FROM properties AS p WHERE phr.property_id = p.id;
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='propertyhouserule',
+            name='tenant',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.tenant'),
+        ),
+    ]
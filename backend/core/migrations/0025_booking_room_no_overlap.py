@@ -0,0 +1,21 @@
+# Generated by Django 4.2.8 on 2026-10-16 21:00
+
+import core.models
+import django.contrib.postgres.constraints
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_propertyhouserule_tenant'),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('room__isnull', False), ('status__in', ['CHECKED_IN', 'CONFIRMED', 'PENDING'])), expressions=[('room', '='), (core.models.DateRange('checkin', 'checkout'), '&&')], name='booking_room_no_overlap'),
+        ),
+    ]
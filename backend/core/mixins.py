@@ -1,22 +1,55 @@
+from functools import cache
+
+from django.db import transaction
 from rest_framework import exceptions
 
 class ProtectedModelMixin:
     protected_field = "protected"
 
+    @classmethod
+    @cache
+    def _diffable_field_names(cls):
+        return tuple(field.attname for field in cls._meta.concrete_fields)
+
     def save(self, *args, **kwargs):
-        if self.pk:
-            original = type(self).objects.get(pk=self.pk)
-            is_protected = getattr(original, self.protected_field)
+        if not self.pk:
+            return super().save(*args, **kwargs)
+        # Lock the row from the protected check until the write, so a concurrent save
+        # can't slip an update past a lock that is being set
+        with transaction.atomic(using=kwargs.get("using")):
+            # Only the protected flag is needed to decide whether the full row must be compared
+            is_protected = (
+                type(self).objects.select_for_update(no_key=True)
+                .filter(pk=self.pk)
+                .values_list(self.protected_field, flat=True)
+                .first()
+            )
             if is_protected:
                 raise exceptions.ValidationError({"detail": "Cannot update protected object"})
-            elif not is_protected and getattr(self, self.protected_field):
-                changed_fields = {
-                    field.name
-                    for field in self._meta.fields
-                    if getattr(original, field.name) != getattr(self, field.name)
-                }
-                if changed_fields - {self.protected_field}:
+            # A save that doesn't write the protected flag cannot lock the object
+            update_fields = kwargs.get("update_fields")
+            locking = update_fields is None or self.protected_field in update_fields
+            if is_protected is not None and locking and getattr(self, self.protected_field):
+                original = type(self).objects.get(pk=self.pk)
+                if any(
+                    getattr(original, name) != getattr(self, name)
+                    for name in self._diffable_field_names()
+                    if name != self.protected_field
+                ):
                     raise exceptions.ValidationError(
                         {"detail": f"Only '{self.protected_field}' can be changed when locking object."}
                     )
-        return super().save(*args, **kwargs)
\ No newline at end of file
+            return super().save(*args, **kwargs)
+
+
+class TenantScopedMixin:
+    """
+    Keeps a denormalized ``tenant`` FK in sync with the owning parent
+    (``tenant_parent_field``) so tenant filters don't join up the hierarchy.
+    """
+    tenant_parent_field = None
+
+    def save(self, *args, **kwargs):
+        parent = getattr(self, self.tenant_parent_field)
+        self.tenant_id = parent.tenant_id
+        return super().save(*args, **kwargs)
@@ -7,7 +7,12 @@ import uuid
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.gis.db import models
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateRangeField, RangeOperators
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
+from django.contrib.gis.geos import Point
 from django.utils import timezone
 
 from .constants import (
@@ -17,12 +22,106 @@ from .constants import (
     ROOM_STATUS_CHOICES,
     MODIFIER_TYPE_CHOICES,
     BOOKING_STATUS_CHOICES,
+    ACTIVE_BOOKING_STATUSES,
     PAYMENT_STATUS_CHOICES,
     PAYMENT_METHOD_CHOICES,
     DEFAULT_TIMEZONE,
     DEFAULT_CURRENCY,
     PRICING_MODEL_STATIC,
+    LAST_LOGIN_UPDATE_INTERVAL,
 )
+from .mixins import TenantScopedMixin
+
+def trigram_index(field_name, name):
+    """
+    GIN trigram index on UPPER(field), the expression Django compares for
+    icontains lookups, so admin search can use an index instead of a scan.
+    """
+    return GinIndex(OpClass(Upper(field_name), name='gin_trgm_ops'), name=name)
+
+
+class DatabaseDefault(models.Expression):
+    """The SQL DEFAULT keyword, the only value PostgreSQL accepts for a generated column."""
+    def as_sql(self, compiler, connection):
+        return 'DEFAULT', []
+
+
+class GeneratedFieldMixin:
+    """
+    Column computed by the database (GENERATED ALWAYS AS ... STORED).
+    Writes always send DEFAULT, and the field is never editable.
+    """
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if kwargs.get('editable') is False:
+            del kwargs['editable']
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        # output_field lets backends that inspect the value (PostGIS placeholders
+        # read value.field.srid on UPDATE) resolve the expression's type
+        return DatabaseDefault(output_field=self)
+
+
+class GeneratedIntegerField(GeneratedFieldMixin, models.IntegerField):
+    # Inserts read the computed value back
+    db_returning = True
+
+
+class GeneratedPointField(GeneratedFieldMixin, models.PointField):
+    pass
+
+
+class CITextField(models.TextField):
+    """
+    PostgreSQL citext column: equality, uniqueness and plain btree indexes
+    are case-insensitive. (Django's CIText fields are deprecated in 4.2, and
+    nondeterministic collations would break LIKE-based search.)
+    """
+    def db_type(self, connection):
+        return 'citext'
+
+
+class PgEnumField(models.CharField):
+    """
+    CharField stored in a PostgreSQL ENUM type (4 bytes per value). The type
+    is created by a migration and must be altered there when choices change.
+    """
+    def __init__(self, *args, enum_type=None, **kwargs):
+        self.enum_type = enum_type
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['enum_type'] = self.enum_type
+        return name, path, args, kwargs
+
+    def db_type(self, connection):
+        return self.enum_type
+
+
+class DateRange(models.Func):
+    """daterange(lower, upper) with the default half-open [) bounds."""
+    function = 'daterange'
+    output_field = DateRangeField()
+
+
+class SelectRelatedManager(models.Manager):
+    """
+    Default manager that joins the relations a model's __str__ and API
+    serializer read, so listing rows doesn't fetch them one by one.
+    """
+    def __init__(self, *related_fields):
+        super().__init__()
+        self.related_fields = related_fields
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(*self.related_fields)
+
 
 def get_upload_to(instance, filename):
     suffix = "protected/" if instance.protected else ""
@@ -54,6 +153,9 @@ class State(models.Model):
 
     class Meta:
         db_table = 'state'
+        constraints = [
+            models.UniqueConstraint(fields=['country', 'name'], name='state_country_name_uniq'),
+        ]
 
     def __str__(self):
         return self.name
@@ -69,6 +171,9 @@ class District(models.Model):
 
     class Meta:
         db_table = 'district'
+        constraints = [
+            models.UniqueConstraint(fields=['state', 'name'], name='district_state_name_uniq'),
+        ]
 
     def __str__(self):
         return self.name
@@ -85,6 +190,9 @@ class Municipality(models.Model):
     class Meta:
         db_table = 'municipality'
         verbose_name_plural = 'Municipalities'
+        constraints = [
+            models.UniqueConstraint(fields=['district', 'name'], name='municipality_district_name_uniq'),
+        ]
 
     def __str__(self):
         return self.name
@@ -109,12 +217,26 @@ class Multimedia(models.Model):
     file = models.FileField(upload_to=get_upload_to, max_length=255)
     field_name = models.CharField(max_length=255, blank=True, null=True)
     protected = models.BooleanField(default=False)
+    size_bytes = models.BigIntegerField(default=0)
     created_by = models.ForeignKey("TenantUser", on_delete=models.PROTECT, null=True, blank=True)
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, blank=True, null=True)
     object_id = models.UUIDField(blank=True, null=True)
     content_object = GenericForeignKey("content_type", "object_id")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        # Persist the file size at upload time so storage statistics can be
+        # aggregated in SQL instead of stat-ing every file on disk.
+        if not self.file:
+            self.size_bytes = 0
+        elif not self.size_bytes or not self.file._committed:
+            try:
+                self.size_bytes = self.file.size
+            except OSError:
+                self.size_bytes = 0
+        return super().save(*args, **kwargs)
+
     def on_delete(self):
         self.file.delete()
 
@@ -124,6 +246,16 @@ class Multimedia(models.Model):
     class Meta:
         verbose_name = "Multimedia"
         verbose_name_plural = "Multimedia Files"
+        indexes = [
+            # Covers the orphaned media lookups used by the cleanup utilities
+            models.Index(
+                fields=['created_at'],
+                name='mm_orphan_created_idx',
+                condition=models.Q(content_type__isnull=True, object_id__isnull=True),
+            ),
+            # Covers media lookups of an instance by field name
+            models.Index(fields=['content_type', 'object_id', 'field_name'], name='mm_owner_field_idx'),
+        ]
 
 # ===== Community Models =====
 
@@ -141,6 +273,10 @@ class Community(models.Model):
         db_table = 'community'
         verbose_name_plural = 'Communities'
         unique_together = [['name', 'municipality']]
+        indexes = [
+            trigram_index('name', 'community_name_trgm_idx'),
+            trigram_index('description', 'community_desc_trgm_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -150,7 +286,7 @@ class Community(models.Model):
 class Tenant(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.TextField()
-    contact_email = models.TextField(null=True, blank=True)
+    contact_email = CITextField(null=True, blank=True)
     contact_phone = models.TextField(null=True, blank=True)
     registration_number = models.TextField(null=True, blank=True)
     currency = models.CharField(max_length=8, default=DEFAULT_CURRENCY)
@@ -187,8 +323,8 @@ class TenantUser(AbstractBaseUser, PermissionsMixin):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='users', null=True, blank=True)
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='RECEPTIONIST')
-    user_name = models.TextField(unique=True)
-    email = models.TextField(null=True, blank=True)
+    user_name = CITextField(unique=True)
+    email = CITextField(null=True, blank=True)
     full_name = models.TextField(null=True, blank=True)
     mobile_number = models.TextField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
@@ -209,19 +345,25 @@ class TenantUser(AbstractBaseUser, PermissionsMixin):
     class Meta:
         db_table = 'tenant_users'
         unique_together = [['tenant', 'user_name']]
+        indexes = [
+            models.Index(fields=['tenant', 'role'], name='tenant_user_role_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user_name} ({self.tenant.name if self.tenant else 'No Tenant'})"
 
     def update_last_login(self):
-        self.last_login = timezone.now()
-        self.save(update_fields=['last_login'])
+        now = timezone.now()
+        if self.last_login and now - self.last_login < LAST_LOGIN_UPDATE_INTERVAL:
+            return
+        self.last_login = now
+        type(self).objects.filter(pk=self.pk).update(last_login=now)
 
 
 class TenantApiKey(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='api_keys')
-    key = models.TextField(unique=True)
+    key = models.CharField(max_length=128, unique=True)
     description = models.TextField(null=True, blank=True)
     scopes = models.JSONField(default=list)
     disabled = models.BooleanField(default=False)
@@ -229,6 +371,9 @@ class TenantApiKey(models.Model):
 
     class Meta:
         db_table = 'tenant_api_keys'
+        indexes = [
+            GinIndex(fields=['scopes'], opclasses=['jsonb_path_ops'], name='apikey_scopes_gin'),
+        ]
 
     def __str__(self):
         return f"{self.tenant.name} - {self.description or 'API Key'}"
@@ -296,7 +441,8 @@ class Property(models.Model):
     community = models.ForeignKey(Community, on_delete=models.SET_NULL, null=True, blank=True)
     lat = models.FloatField(null=True, blank=True)
     lon = models.FloatField(null=True, blank=True)
-    geom = models.PointField(null=True, blank=True, srid=4326)
+    # GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(lon, lat), 4326)) STORED, see migration 0020
+    geom = GeneratedPointField(null=True, blank=True, srid=4326)
     timezone = models.TextField(default=DEFAULT_TIMEZONE)
     currency = models.CharField(max_length=8, null=True, blank=True)
     status = models.CharField(max_length=20, choices=PROPERTY_STATUS_CHOICES, default='DRAFT')
@@ -314,10 +460,24 @@ class Property(models.Model):
     class Meta:
         db_table = 'properties'
         verbose_name_plural = 'Properties'
+        indexes = [
+            models.Index(fields=['tenant', 'status'], name='property_tenant_status_idx'),
+            trigram_index('name', 'property_name_trgm_idx'),
+            trigram_index('description', 'property_desc_trgm_idx'),
+            trigram_index('address', 'property_address_trgm_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.tenant.name})"
 
+    def save(self, *args, **kwargs):
+        # Mirror the generated column so the saved instance reads consistently
+        if self.lat is not None and self.lon is not None:
+            self.geom = Point(self.lon, self.lat, srid=4326)
+        else:
+            self.geom = None
+        return super().save(*args, **kwargs)
+
 
 class PropertyAmenity(models.Model):
     property = models.ForeignKey(Property, on_delete=models.CASCADE)
@@ -327,7 +487,10 @@ class PropertyAmenity(models.Model):
         db_table = 'property_amenities'
         unique_together = [['property', 'amenity']]
 
-class PropertyHouseRule(models.Model):
+class PropertyHouseRule(TenantScopedMixin, models.Model):
+    tenant_parent_field = 'property'
+
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='+', editable=False)
     property = models.ForeignKey(Property, on_delete=models.CASCADE)
     house_rule = models.ForeignKey(HouseRule, on_delete=models.CASCADE)
     order = models.IntegerField(default=0)
@@ -340,8 +503,11 @@ class PropertyHouseRule(models.Model):
 
 # ===== Room Models =====
 
-class RoomType(models.Model):
+class RoomType(TenantScopedMixin, models.Model):
+    tenant_parent_field = 'property'
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='+', editable=False)
     property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='room_types')
     name = models.TextField()
     slug = models.TextField(null=True, blank=True)
@@ -352,6 +518,8 @@ class RoomType(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SelectRelatedManager('property')
+
     class Meta:
         db_table = 'room_types'
 
@@ -359,8 +527,11 @@ class RoomType(models.Model):
         return f"{self.name} - {self.property.name}"
 
 
-class Room(models.Model):
+class Room(TenantScopedMixin, models.Model):
+    tenant_parent_field = 'room_type'
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='+', editable=False)
     room_type = models.ForeignKey(RoomType, on_delete=models.CASCADE, related_name='rooms')
     room_number = models.TextField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=ROOM_STATUS_CHOICES, default='AVAILABLE')
@@ -369,16 +540,24 @@ class Room(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SelectRelatedManager('room_type')
+
     class Meta:
         db_table = 'rooms'
+        indexes = [
+            models.Index(fields=['room_type', 'status'], name='room_type_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.room_number} - {self.room_type.name}"
 
 # ===== Rate Plans =====
 
-class RatePlan(models.Model):
+class RatePlan(TenantScopedMixin, models.Model):
+    tenant_parent_field = 'property'
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='+', editable=False)
     property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='rate_plans')
     room_type = models.ForeignKey(RoomType, on_delete=models.SET_NULL, null=True, blank=True, related_name='rate_plans')
     name = models.TextField()
@@ -399,12 +578,28 @@ class RatePlan(models.Model):
         return f"{self.name} - {self.property.name}"
 
 
+ALL_DAYS_MASK = 0b1111111
+
+
+def weekdays_to_mask(days):
+    """
+    Pack ISO weekdays (1 = Monday ... 7 = Sunday, 0 also read as Sunday) into
+    a bitmask with bit ``day - 1`` set. An empty list means every day.
+    """
+    if not days:
+        return ALL_DAYS_MASK
+    mask = 0
+    for day in days:
+        mask |= 1 << ((int(day) - 1) % 7)
+    return mask
+
+
 class RatePlanRule(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     rate_plan = models.ForeignKey(RatePlan, on_delete=models.CASCADE, related_name='rules')
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
-    days_of_week = models.JSONField(default=list, null=True, blank=True)
+    days_of_week_mask = models.PositiveSmallIntegerField(default=ALL_DAYS_MASK)
     min_occupancy = models.IntegerField(null=True, blank=True)
     max_occupancy = models.IntegerField(null=True, blank=True)
     modifier_type = models.CharField(max_length=20, choices=MODIFIER_TYPE_CHOICES, default='AMOUNT')
@@ -415,21 +610,47 @@ class RatePlanRule(models.Model):
     class Meta:
         db_table = 'rate_plan_rules'
 
+    @property
+    def days_of_week(self):
+        return [day for day in range(1, 8) if self.days_of_week_mask >> (day - 1) & 1]
+
+    @days_of_week.setter
+    def days_of_week(self, days):
+        self.days_of_week_mask = weekdays_to_mask(days)
+
+    def applies_on(self, day):
+        return bool(self.days_of_week_mask >> (day.isoweekday() - 1) & 1)
+
 
 # ===== Inventory Models =====
 
-class Inventory(models.Model):
+class Inventory(TenantScopedMixin, models.Model):
+    tenant_parent_field = 'room_type'
+
     id = models.BigAutoField(primary_key=True)
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='+', editable=False)
     room_type = models.ForeignKey(RoomType, on_delete=models.CASCADE, related_name='inventory')
     dt = models.DateField()
     available_count = models.IntegerField(default=0)
     blocked_count = models.IntegerField(default=0)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SelectRelatedManager('room_type')
+
     class Meta:
         db_table = 'inventory'
         unique_together = [['room_type', 'dt']]
         verbose_name_plural = 'Inventories'
+        indexes = [
+            # Only dates with free rooms, carrying the counts so availability
+            # scans stay index-only; plain range scans use the unique index
+            models.Index(
+                fields=['room_type', 'dt'],
+                include=['available_count', 'blocked_count'],
+                condition=models.Q(available_count__gt=models.F('blocked_count')),
+                name='inv_avail_partial',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.room_type.name} - {self.dt}"
@@ -448,7 +669,7 @@ class ChannelAllocation(models.Model):
 
 
 class InventoryHold(models.Model):
-    hold_token = models.TextField(primary_key=True)
+    hold_token = models.CharField(max_length=64, primary_key=True)
     tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE)
     room_type = models.ForeignKey(RoomType, on_delete=models.CASCADE)
     start_date = models.DateField()
@@ -467,7 +688,7 @@ class InventoryHold(models.Model):
 class Guest(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.TextField()
-    email = models.TextField(null=True, blank=True)
+    email = CITextField(null=True, blank=True)
     phone = models.TextField(null=True, blank=True)
     nationality = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -495,7 +716,7 @@ class TenantGuestProfile(models.Model):
 
 class Booking(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    external_id = models.TextField(null=True, blank=True)
+    external_id = models.CharField(max_length=128, null=True, blank=True)
     tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, related_name='bookings')
     property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='bookings')
     room_type = models.ForeignKey(RoomType, on_delete=models.CASCADE, related_name='bookings')
@@ -503,25 +724,64 @@ class Booking(models.Model):
     source = models.TextField(default='MARKETPLACE')
     checkin = models.DateField()
     checkout = models.DateField()
-    nights = models.IntegerField()
+    # GENERATED ALWAYS AS (checkout - checkin) STORED, see migration 0016
+    nights = GeneratedIntegerField()
     guests_count = models.IntegerField(default=1)
-    status = models.CharField(max_length=20, choices=BOOKING_STATUS_CHOICES, default='PENDING')
-    payment_status = models.CharField(max_length=20, choices=PAYMENT_STATUS_CHOICES, default='PENDING')
+    status = PgEnumField(max_length=20, choices=BOOKING_STATUS_CHOICES, default='PENDING', enum_type='booking_status')
+    payment_status = PgEnumField(max_length=20, choices=PAYMENT_STATUS_CHOICES, default='PENDING', enum_type='payment_status')
     total_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     currency = models.CharField(max_length=8, default=DEFAULT_CURRENCY)
     commission_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
-    hold_token = models.TextField(null=True, blank=True)
+    hold_token = models.CharField(max_length=64, null=True, blank=True)
     created_by_type = models.TextField(default='VISITOR')
     created_by_id = models.UUIDField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SelectRelatedManager('property', 'room_type')
+
     class Meta:
         db_table = 'bookings'
+        indexes = [
+            models.Index(fields=['tenant', 'status', 'checkin'], name='booking_tenant_status_idx'),
+            models.Index(fields=['property', 'status', 'checkin'], name='booking_property_status_idx'),
+            models.Index(fields=['room', 'status', 'checkin', 'checkout'], name='booking_room_dates_idx'),
+            models.Index(fields=['tenant', 'checkin', 'checkout'], name='booking_tenant_dates_idx'),
+            models.Index(
+                fields=['tenant', 'checkin', 'checkout'],
+                condition=models.Q(status__in=sorted(ACTIVE_BOOKING_STATUSES)),
+                name='booking_active_idx',
+            ),
+            models.Index(fields=['tenant', 'nights'], name='booking_tenant_nights_idx'),
+            trigram_index('external_id', 'booking_ext_id_trgm_idx'),
+        ]
+        constraints = [
+            # Checked at COMMIT so concurrent booking writers don't serialize on the index
+            models.UniqueConstraint(
+                fields=['tenant', 'external_id'],
+                name='booking_ext_uniq',
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+            # A room can't hold two active bookings for overlapping nights
+            ExclusionConstraint(
+                name='booking_room_no_overlap',
+                expressions=[
+                    ('room', RangeOperators.EQUAL),
+                    (DateRange('checkin', 'checkout'), RangeOperators.OVERLAPS),
+                ],
+                condition=models.Q(room__isnull=False, status__in=sorted(ACTIVE_BOOKING_STATUSES)),
+            ),
+        ]
 
     def __str__(self):
         return f"Booking {self.id} - {self.property.name}"
 
+    def save(self, *args, **kwargs):
+        # Mirror the generated column so the saved instance reads consistently
+        if self.checkin and self.checkout:
+            self.nights = (self.checkout - self.checkin).days
+        return super().save(*args, **kwargs)
+
 
 class BookingItem(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -558,7 +818,7 @@ class Payment(models.Model):
     method = models.CharField(max_length=20, choices=PAYMENT_METHOD_CHOICES, default='GATEWAY')
     amount = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
     currency = models.CharField(max_length=8, default=DEFAULT_CURRENCY)
-    status = models.CharField(max_length=20, choices=PAYMENT_STATUS_CHOICES, default='PENDING')
+    status = PgEnumField(max_length=20, choices=PAYMENT_STATUS_CHOICES, default='PENDING', enum_type='payment_status')
     transaction_id = models.TextField(null=True, blank=True)
     raw_payload = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -609,11 +869,14 @@ class WebhookRegistration(models.Model):
 
     class Meta:
         db_table = 'webhook_registrations'
+        indexes = [
+            GinIndex(fields=['events'], opclasses=['jsonb_path_ops'], name='webhook_events_gin'),
+        ]
 
 
 class IdempotencyKey(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    key = models.TextField(unique=True)
+    key = models.CharField(max_length=128, unique=True)
     tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, null=True, blank=True)
     endpoint = models.TextField(null=True, blank=True)
     request_hash = models.TextField(null=True, blank=True)
@@ -1,6 +1,16 @@
 from rest_framework import permissions
-from .models import TenantUser
-from uuid import UUID
+from .constants import OWNER_OR_MANAGER_ROLES
+
+
+def get_token_user_role(request):
+    """
+    Role of the user the request's JWT was issued to.
+    TenantJWTAuthentication has already loaded that user as request.user,
+    so the role is read from it instead of querying TenantUser again.
+    """
+    if not request.auth or not request.auth.get('user_id'):
+        return None
+    return getattr(request.user, 'role', None)
 
 
 class IsTenantUser(permissions.BasePermission):
@@ -15,55 +25,27 @@ class IsTenantUser(permissions.BasePermission):
 
 class IsTenantOwner(permissions.BasePermission):
     def has_permission(self, request, view):
-        if not request.auth:
-            return False
-
-        user_id = request.auth.get('user_id')
-        if not user_id:
-            return False
-
-        try:
-            user = TenantUser.objects.get(id=UUID(user_id))
-            return user.role == 'OWNER'
-        except TenantUser.DoesNotExist:
-            return False
+        return get_token_user_role(request) == 'OWNER'
 
 
 class IsTenantOwnerOrManager(permissions.BasePermission):
     def has_permission(self, request, view):
-        if not request.auth:
-            return False
-
-        user_id = request.auth.get('user_id')
-        if not user_id:
-            return False
-
-        try:
-            user = TenantUser.objects.get(id=UUID(user_id))
-            return user.role in ['OWNER', 'MANAGER']
-        except TenantUser.DoesNotExist:
-            return False
+        return get_token_user_role(request) in OWNER_OR_MANAGER_ROLES
 
 
 class BelongsToTenant(permissions.BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return bool(request.user.tenant)
+        return getattr(request.user, 'tenant_id', None) is not None
 
     def has_object_permission(self, request, view, obj):
-        tenant = getattr(request.user, 'tenant', None)
-        if not tenant:
+        tenant_id = getattr(request.user, 'tenant_id', None)
+        if not tenant_id:
             return False
 
-        if hasattr(obj, 'tenant'):
-            return obj.tenant_id == tenant.id
-        if hasattr(obj, 'property') and hasattr(obj.property, 'tenant'):
-            return obj.property.tenant.id == tenant.id
-        if hasattr(obj, 'room_type') and hasattr(obj.room_type, 'property') and hasattr(obj.room_type.property, 'tenant'):
-            return obj.room_type.property.tenant.id == tenant.id
-
-        return False
+        # Every tenant-scoped model carries its own (denormalized) tenant_id
+        return getattr(obj, 'tenant_id', None) == tenant_id
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -71,15 +53,7 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return bool(request.auth)
 
-        if not request.auth:
-            return False
-
-        user_id = request.auth.get('user_id')
-        try:
-            user = TenantUser.objects.get(id=UUID(user_id))
-            return user.role == 'OWNER'
-        except TenantUser.DoesNotExist:
-            return False
+        return get_token_user_role(request) == 'OWNER'
 
 
 class IsSuperAdmin(permissions.BasePermission):
@@ -1,14 +1,44 @@
 """
 DRF Serializers for GrihaStay application
 """
+from contextlib import contextmanager
+
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from django.contrib.gis.geos import Point
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, connection, transaction
 
 from config.utils import mixins
 from .models import *
 
 
+class InBulkManyRelatedField(serializers.ManyRelatedField):
+    """
+    Many-valued primary key field that resolves every submitted id with a
+    single in_bulk() query instead of one lookup per item.
+    """
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        queryset = self.child_relation.get_queryset()
+        pk_field = queryset.model._meta.pk
+        pks = []
+        for value in data:
+            try:
+                pks.append(pk_field.to_python(value))
+            except (DjangoValidationError, TypeError, ValueError):
+                self.child_relation.fail('incorrect_type', data_type=type(value).__name__)
+
+        found = queryset.in_bulk(pks)
+        for pk in pks:
+            if pk not in found:
+                self.child_relation.fail('does_not_exist', pk_value=pk)
+        return [found[pk] for pk in pks]
+
+
 # ===== Location Serializers =====
 
 class CountrySerializer(serializers.ModelSerializer):
@@ -55,6 +85,7 @@ class MultimediaSerializer(serializers.ModelSerializer):
     class Meta:
         model = Multimedia
         fields = "__all__"
+        read_only_fields = ['size_bytes']
 
     def validate(self, data):
         if self.instance is None and not data.get("file"):
@@ -135,34 +166,38 @@ class TenantRegistrationSerializer(serializers.Serializer):
     full_name = serializers.CharField(max_length=255)
     mobile_number = serializers.CharField(max_length=50, required=False, allow_blank=True)
     
-    def validate_user_name(self, value):
-        if TenantUser.objects.filter(user_name=value).exists():
-            raise serializers.ValidationError("User name already exists")
-        return value
-    
     def create(self, validated_data):
-        # Create tenant
-        tenant = Tenant.objects.create(
-            name=validated_data['tenant_name'],
-            contact_email=validated_data.get('contact_email', ''),
-            contact_phone=validated_data.get('contact_phone', ''),
-            registration_number=validated_data.get('registration_number', ''),
-            currency=validated_data.get('currency', 'NPR'),
-            timezone=validated_data.get('timezone', 'Asia/Kathmandu'),
-        )
-        
-        # Create first user (admin/owner)
-        user = TenantUser.objects.create_user(
-            user_name=validated_data['user_name'],
-            # email=validated_data['email'],
-            password=validated_data['password'],
-            full_name=validated_data['full_name'],
-            mobile_number=validated_data.get('mobile_number', ''),
-            tenant=tenant,
-            role='OWNER',
-        )
-        user.set_password(validated_data['password'])
-        user.save()
+        # The unique user_name constraint is the duplicate check; the tenant
+        # insert is rolled back with the user insert when it fires
+        try:
+            with transaction.atomic():
+                # Create tenant
+                tenant = Tenant.objects.create(
+                    name=validated_data['tenant_name'],
+                    contact_email=validated_data.get('contact_email', ''),
+                    contact_phone=validated_data.get('contact_phone', ''),
+                    registration_number=validated_data.get('registration_number', ''),
+                    currency=validated_data.get('currency', 'NPR'),
+                    timezone=validated_data.get('timezone', 'Asia/Kathmandu'),
+                )
+
+                # Create first user (admin/owner)
+                user = TenantUser.objects.create_user(
+                    user_name=validated_data['user_name'],
+                    # email=validated_data['email'],
+                    password=validated_data['password'],
+                    full_name=validated_data['full_name'],
+                    mobile_number=validated_data.get('mobile_number', ''),
+                    tenant=tenant,
+                    role='OWNER',
+                )
+        except IntegrityError as exc:
+            # Only the user_name unique constraints (tenant_users_user_name_key and
+            # the (tenant, user_name) one) mean a taken name; anything else is a bug
+            constraint = getattr(getattr(exc.__cause__, 'diag', None), 'constraint_name', None)
+            if constraint and 'user_name' in constraint:
+                raise serializers.ValidationError({'user_name': ['User name already exists']})
+            raise
         
         return {'tenant': tenant, 'user': user}
 
@@ -229,14 +264,14 @@ class AmenitySerializer(serializers.ModelSerializer):
 
 class PropertySerializer(mixins.GenericMediaMixin,serializers.ModelSerializer):
     amenities_list = AmenitySerializer(source='amenities', many=True, read_only=True)
-    amenity_ids = serializers.PrimaryKeyRelatedField(
+    amenity_ids = InBulkManyRelatedField(
         source='amenities',
-        many=True,
-        queryset=Amenity.objects.all(),
+        child_relation=serializers.PrimaryKeyRelatedField(queryset=Amenity.objects.all()),
         write_only=True,
         required=False
     )
     property_type_name = serializers.CharField(source='property_type.name', read_only=True)
+    geom = serializers.CharField(read_only=True)
     state_detail = StateSerializer(source='state', read_only=True)
     district_detail = DistrictSerializer(source='district', read_only=True)
     municipality_detail = MunicipalitySerializer(source='municipality', read_only=True)
@@ -266,12 +301,6 @@ class PropertySerializer(mixins.GenericMediaMixin,serializers.ModelSerializer):
         amenities = validated_data.pop('amenities', [])
         property_obj = Property.objects.create(**validated_data)
         property_obj.amenities.set(amenities)
-        
-        # Set geom from lat/lon if provided
-        if property_obj.lat and property_obj.lon:
-            property_obj.geom = Point(property_obj.lon, property_obj.lat)
-            property_obj.save()
-        
         return property_obj
     
     def update(self, instance, validated_data):
@@ -280,11 +309,6 @@ class PropertySerializer(mixins.GenericMediaMixin,serializers.ModelSerializer):
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         
-        # Update geom from lat/lon if changed
-        if 'lat' in validated_data or 'lon' in validated_data:
-            if instance.lat and instance.lon:
-                instance.geom = Point(instance.lon, instance.lat)
-        
         instance.save()
         
         if amenities is not None:
@@ -329,7 +353,8 @@ class PropertyHouseRuleBulkCreateSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         rules_data = validated_data['rules']
-        instances = [PropertyHouseRule(**data) for data in rules_data]
+        # bulk_create() skips save(), so the denormalized tenant is set here
+        instances = [PropertyHouseRule(tenant_id=data['property'].tenant_id, **data) for data in rules_data]
         return PropertyHouseRule.objects.bulk_create(instances)
 
 # ===== Room Serializers =====
@@ -356,9 +381,15 @@ class RoomSerializer(mixins.GenericMediaMixin, serializers.ModelSerializer):
 # ===== Rate Plan Serializers =====
 
 class RatePlanRuleSerializer(serializers.ModelSerializer):
+    days_of_week = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=7),
+        required=False,
+        allow_null=True,
+    )
+
     class Meta:
         model = RatePlanRule
-        fields = '__all__'
+        exclude = ['days_of_week_mask']
 
 
 class RatePlanSerializer(serializers.ModelSerializer):
@@ -425,11 +456,38 @@ class BookingGuestInfoSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+BOOKING_CONSTRAINT_ERRORS = {
+    'booking_room_no_overlap': {'room': ['Room is already booked for these dates']},
+    'booking_ext_uniq': {'external_id': ['A booking with this external id already exists']},
+}
+
+
+@contextmanager
+def booking_constraint_errors():
+    """
+    Run a booking write in its own transaction and turn violations of the
+    booking constraints into validation errors (400) instead of a 500.
+    """
+    try:
+        with transaction.atomic():
+            # booking_ext_uniq is deferred to COMMIT, which is outside this block
+            # when an outer transaction is open; check it at the write instead
+            with connection.cursor() as cursor:
+                cursor.execute('SET CONSTRAINTS booking_ext_uniq IMMEDIATE')
+            yield
+    except IntegrityError as exc:
+        constraint = getattr(getattr(exc.__cause__, 'diag', None), 'constraint_name', None)
+        if constraint in BOOKING_CONSTRAINT_ERRORS:
+            raise serializers.ValidationError(BOOKING_CONSTRAINT_ERRORS[constraint])
+        raise
+
+
 class BookingSerializer(serializers.ModelSerializer):
     items = BookingItemSerializer(many=True, read_only=True)
     guest_info = BookingGuestInfoSerializer(many=True, read_only=True)
     property_name = serializers.CharField(source='property.name', read_only=True)
     room_type_name = serializers.CharField(source='room_type.name', read_only=True)
+    nights = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Booking
@@ -440,13 +498,14 @@ class BookingSerializer(serializers.ModelSerializer):
         if data.get('checkout') and data.get('checkin'):
             if data['checkout'] <= data['checkin']:
                 raise serializers.ValidationError("Checkout date must be after checkin date")
-            
-            # Calculate nights
-            delta = data['checkout'] - data['checkin']
-            data['nights'] = delta.days
         
         return data
 
+    def save(self, **kwargs):
+        # Overlaps and duplicate external ids are rejected by database constraints
+        with booking_constraint_errors():
+            return super().save(**kwargs)
+
 
 class BookingCreateSerializer(serializers.Serializer):
     """Serializer for creating a booking with guest info"""
@@ -1,15 +1,12 @@
 """
 DRF ViewSets for GrihaStay application
 """
-from uuid import UUID
-
 from django.http import request
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from .models import *
@@ -26,6 +23,22 @@ def get_tenant_from_token(request):
     return None
 
 
+class TenantScopedViewSetMixin:
+    """
+    Restricts the viewset's queryset to the requesting user's tenant with a
+    single WHERE clause on ``tenant_lookup`` (the tenant id is read from the
+    already-authenticated user, so no Tenant query is needed).
+    """
+    tenant_lookup = 'tenant'
+
+    def get_queryset(self):
+        tenant_id = getattr(self.request.user, 'tenant_id', None)
+        queryset = super().get_queryset()
+        if not tenant_id:
+            return queryset.none()
+        return queryset.filter(**{f'{self.tenant_lookup}_id': tenant_id})
+
+
 # ===== Location ViewSets =====
 
 class CountryViewSet(viewsets.ModelViewSet):
@@ -113,7 +126,7 @@ class TenantViewSet(viewsets.ModelViewSet):
         return Tenant.objects.none()
 
 
-class TenantUserViewSet(viewsets.ModelViewSet):
+class TenantUserViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = TenantUser.objects.all()
     permission_classes = [IsTenantUser]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
@@ -125,13 +138,6 @@ class TenantUserViewSet(viewsets.ModelViewSet):
             return TenantUserCreateSerializer
         return TenantUserSerializer
     
-    def get_queryset(self):
-        # Users can only see users from their own tenant
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return TenantUser.objects.filter(tenant=tenant)
-        return TenantUser.objects.none()
-
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             return [IsTenantOwner()]
@@ -144,17 +150,10 @@ class TenantUserViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def me(self, request):
         """Get current user information"""
-        if hasattr(request, 'auth') and request.auth:
-            user_id = request.auth.get('user_id')
-            if user_id:
-                try:
-                    user_id = UUID(request.auth.get('user_id'))
-                except (TypeError, ValueError):
-                    return Response({'error': 'Invalid user id'}, status=400)
-
-                user = get_object_or_404(TenantUser, id=user_id)
-                serializer = self.get_serializer(user)
-                return Response(serializer.data)
+        # request.user is the token's user, already loaded by TenantJWTAuthentication
+        if request.auth and request.auth.get('user_id') and request.user.is_authenticated:
+            serializer = self.get_serializer(request.user)
+            return Response(serializer.data)
         return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
 
 
@@ -227,24 +226,15 @@ class HouseRuleViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'description']
 
 
-class PropertyHouseRuleViewSet(viewsets.ModelViewSet):
+class PropertyHouseRuleViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     """Property-specific house rule associations"""
-    queryset = PropertyHouseRule.objects.all()
+    queryset = PropertyHouseRule.objects.select_related('house_rule', 'property')
     serializer_class = PropertyHouseRuleSerializer
     permission_classes = [IsAuthenticated, BelongsToTenant]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['property', 'house_rule']
     ordering_fields = ['order']
 
-    def get_queryset(self):
-        """Only associations for properties owned by current tenant"""
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return PropertyHouseRule.objects.filter(
-                property__tenant=tenant
-            ).select_related('house_rule', 'property').order_by('order')
-        return PropertyHouseRule.objects.none()
-
     def perform_create(self, serializer):
         """Ensure property belongs to tenant before creating association"""
         property_obj = serializer.validated_data['property']
@@ -304,83 +294,52 @@ class PropertyHouseRuleViewSet(viewsets.ModelViewSet):
 
 # ===== Room ViewSets =====
 
-class RoomTypeViewSet(viewsets.ModelViewSet):
+class RoomTypeViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = RoomType.objects.all()
     serializer_class = RoomTypeSerializer
     permission_classes = [IsAuthenticated, BelongsToTenant]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['property']
     search_fields = ['name', 'description']
-    
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return RoomType.objects.filter(property__tenant=tenant)
-        return RoomType.objects.none()
 
 
-class RoomViewSet(viewsets.ModelViewSet):
+class RoomViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = Room.objects.all()
     serializer_class = RoomSerializer
     permission_classes = [IsAuthenticated, BelongsToTenant]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['room_type', 'status']
     search_fields = ['room_number']
-    
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return Room.objects.filter(room_type__property__tenant=tenant)
-        return Room.objects.none()
 
 # ===== Rate Plan ViewSets =====
 
-class RatePlanViewSet(viewsets.ModelViewSet):
+class RatePlanViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = RatePlan.objects.all()
     serializer_class = RatePlanSerializer
     permission_classes = [IsAuthenticated, BelongsToTenant]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['property', 'room_type', 'active']
     search_fields = ['name', 'description']
-    
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return RatePlan.objects.filter(property__tenant=tenant)
-        return RatePlan.objects.none()
 
 
-class RatePlanRuleViewSet(viewsets.ModelViewSet):
+class RatePlanRuleViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = RatePlanRule.objects.all()
+    tenant_lookup = 'rate_plan__tenant'
     serializer_class = RatePlanRuleSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['rate_plan']
-    
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return RatePlanRule.objects.filter(rate_plan__property__tenant=tenant)
-        return RatePlanRule.objects.none()
 
 
 # ===== Inventory ViewSets =====
 
-class InventoryViewSet(viewsets.ModelViewSet):
+class InventoryViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = Inventory.objects.all()
     serializer_class = InventorySerializer
     permission_classes = [IsAuthenticated, BelongsToTenant]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['room_type', 'dt']
     ordering_fields = ['dt']
-    
-    def get_queryset(self):
-        print(">>> get_queryset reached")
-
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return Inventory.objects.filter(room_type__property__tenant=tenant)
-        return Inventory.objects.none()
 
 
 class ChannelAllocationViewSet(viewsets.ModelViewSet):
@@ -401,19 +360,13 @@ class GuestViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'email', 'phone']
 
 
-class TenantGuestProfileViewSet(viewsets.ModelViewSet):
+class TenantGuestProfileViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = TenantGuestProfile.objects.all()
     serializer_class = TenantGuestProfileSerializer
     permission_classes = [IsAuthenticated, BelongsToTenant]
     filter_backends = [filters.SearchFilter]
     search_fields = ['display_name', 'notes']
     
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return TenantGuestProfile.objects.filter(tenant=tenant)
-        return TenantGuestProfile.objects.none()
-    
     def perform_create(self, serializer):
         tenant = get_tenant_from_token(self.request)
         serializer.save(tenant=tenant)
@@ -421,7 +374,7 @@ class TenantGuestProfileViewSet(viewsets.ModelViewSet):
 
 # ===== Booking ViewSets =====
 
-class BookingViewSet(viewsets.ModelViewSet):
+class BookingViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     permission_classes = [IsAuthenticated, BelongsToTenant]
@@ -430,52 +383,39 @@ class BookingViewSet(viewsets.ModelViewSet):
     search_fields = ['external_id']
     ordering_fields = ['checkin', 'checkout', 'created_at']
     
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return Booking.objects.filter(tenant=tenant)
-        return Booking.objects.none()
-    
     def perform_create(self, serializer):
         tenant = get_tenant_from_token(self.request)
         user_id = self.request.auth.get('user_id') if hasattr(self.request, 'auth') else None
         serializer.save(tenant=tenant, created_by_id=user_id, created_by_type='TENANT_USER')
+
+    def _set_status(self, status_value):
+        """Move a booking to a new status, reporting constraint violations as 400s"""
+        booking = self.get_object()
+        booking.status = status_value
+        with booking_constraint_errors():
+            booking.save()
+        serializer = self.get_serializer(booking)
+        return Response(serializer.data)
     
     @action(detail=True, methods=['post'])
     def confirm(self, request, pk=None):
         """Confirm a booking"""
-        booking = self.get_object()
-        booking.status = 'CONFIRMED'
-        booking.save()
-        serializer = self.get_serializer(booking)
-        return Response(serializer.data)
+        return self._set_status('CONFIRMED')
     
     @action(detail=True, methods=['post'])
     def cancel(self, request, pk=None):
         """Cancel a booking"""
-        booking = self.get_object()
-        booking.status = 'CANCELLED'
-        booking.save()
-        serializer = self.get_serializer(booking)
-        return Response(serializer.data)
+        return self._set_status('CANCELLED')
     
     @action(detail=True, methods=['post'])
     def checkin(self, request, pk=None):
         """Check in a booking"""
-        booking = self.get_object()
-        booking.status = 'CHECKED_IN'
-        booking.save()
-        serializer = self.get_serializer(booking)
-        return Response(serializer.data)
+        return self._set_status('CHECKED_IN')
     
     @action(detail=True, methods=['post'])
     def checkout(self, request, pk=None):
         """Check out a booking"""
-        booking = self.get_object()
-        booking.status = 'CHECKED_OUT'
-        booking.save()
-        serializer = self.get_serializer(booking)
-        return Response(serializer.data)
+        return self._set_status('CHECKED_OUT')
 
 
 class BookingItemViewSet(viewsets.ModelViewSet):
@@ -496,38 +436,28 @@ class BookingGuestInfoViewSet(viewsets.ModelViewSet):
 
 # ===== Payment ViewSets =====
 
-class PaymentViewSet(viewsets.ModelViewSet):
+class PaymentViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = Payment.objects.all()
+    tenant_lookup = 'booking__tenant'
     serializer_class = PaymentSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['booking', 'status', 'method']
     ordering_fields = ['created_at']
-    
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return Payment.objects.filter(booking__tenant=tenant)
-        return Payment.objects.none()
 
 
 # ===== Invoice & Payout ViewSets =====
 
-class InvoiceViewSet(viewsets.ModelViewSet):
+class InvoiceViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = Invoice.objects.all()
+    tenant_lookup = 'booking__tenant'
     serializer_class = InvoiceSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['booking']
-    
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return Invoice.objects.filter(booking__tenant=tenant)
-        return Invoice.objects.none()
 
 
-class PayoutViewSet(viewsets.ModelViewSet):
+class PayoutViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = Payout.objects.all()
     serializer_class = PayoutSerializer
     permission_classes = [IsAuthenticated, IsTenantOwner]
@@ -535,12 +465,6 @@ class PayoutViewSet(viewsets.ModelViewSet):
     filterset_fields = ['status']
     ordering_fields = ['scheduled_at', 'processed_at']
     
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return Payout.objects.filter(tenant=tenant)
-        return Payout.objects.none()
-    
     def perform_create(self, serializer):
         tenant = get_tenant_from_token(self.request)
         serializer.save(tenant=tenant)
@@ -548,35 +472,23 @@ class PayoutViewSet(viewsets.ModelViewSet):
 
 # ===== Webhook & Audit ViewSets =====
 
-class WebhookRegistrationViewSet(viewsets.ModelViewSet):
+class WebhookRegistrationViewSet(TenantScopedViewSetMixin, viewsets.ModelViewSet):
     queryset = WebhookRegistration.objects.all()
     serializer_class = WebhookRegistrationSerializer
     permission_classes = [IsAuthenticated, IsTenantOwner]
     
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return WebhookRegistration.objects.filter(tenant=tenant)
-        return WebhookRegistration.objects.none()
-    
     def perform_create(self, serializer):
         tenant = get_tenant_from_token(self.request)
         serializer.save(tenant=tenant)
 
 
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+class AuditLogViewSet(TenantScopedViewSetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = AuditLog.objects.all()
     serializer_class = AuditLogSerializer
     permission_classes = [IsAuthenticated, IsTenantOwnerOrManager]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['actor', 'action']
     ordering_fields = ['created_at']
-    
-    def get_queryset(self):
-        tenant = get_tenant_from_token(self.request)
-        if tenant:
-            return AuditLog.objects.filter(tenant=tenant)
-        return AuditLog.objects.none()
 
 
 # ===== Media Cleanup ViewSet =====
@@ -17,10 +17,19 @@ echo "Running migrations..."
 python manage.py makemigrations core --noinput || true
 python manage.py migrate --noinput
 
+# Keep monthly audit log partitions ahead of the calendar
+echo "Creating audit log partitions..."
+python manage.py create_audit_log_partitions
+
 # Collect static files
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
+# Pre-generate the OpenAPI spec so /swagger.json and /swagger.yaml are served as static files
+echo "Generating OpenAPI schema..."
+python manage.py generate_swagger staticfiles/swagger.json --format json --overwrite
+python manage.py generate_swagger staticfiles/swagger.yaml --format yaml --overwrite
+
 # Start server
 echo "Starting server..."
 python manage.py runserver 0.0.0.0:8000